@@ -0,0 +1,14 @@
+"""Shared NumPy audio helpers behind the compose_*.py scripts.
+
+Scripts synthesize float buffers in [-1, 1]; everything that touches whole
+tracks (file output, mixing, filtering) lives here as batched NumPy code.
+"""
+from .filters import IIRFilter, bandpass, highpass, lfilter, lowpass, one_pole
+from .mixer import Timeline
+from .oscillators import SAW, SINE, SQUARE, OscillatorBank, Wavetable
+from .polyphony import Chord, VoiceAllocator
+from .sections import SectionCache
+from .sequencer import Event, Instrument, Sequencer
+from .stems import mix_sequenced, mix_stems, render_stem, render_stems
+from .voices import VoiceCache
+from .wav import FORMATS, WavReader, WavWriter, from_pcm, to_pcm, write_wav
@@ -0,0 +1,113 @@
+import math
+from functools import lru_cache
+import numpy as np
+
+BLOCK = 128 # samples per block; the in-block work is a (blocks, BLOCK) @ (BLOCK, BLOCK) matmul
+
+def one_pole(alpha):
+    # y[n] = alpha * x[n] + (1 - alpha) * y[n-1], the scripts' "muffled" low-pass
+    return (alpha,), (1.0, -(1.0 - alpha))
+
+def _rbj(cutoff, sample_rate, q):
+    w0 = 2 * math.pi * cutoff / sample_rate
+    return math.cos(w0), math.sin(w0) / (2 * q)
+
+def lowpass(cutoff, sample_rate=44100, q=math.sqrt(0.5)):
+    # Biquads follow the RBJ audio EQ cookbook
+    cos_w, alpha = _rbj(cutoff, sample_rate, q)
+    b = ((1 - cos_w) / 2, 1 - cos_w, (1 - cos_w) / 2)
+    return b, (1 + alpha, -2 * cos_w, 1 - alpha)
+
+def highpass(cutoff, sample_rate=44100, q=math.sqrt(0.5)):
+    cos_w, alpha = _rbj(cutoff, sample_rate, q)
+    b = ((1 + cos_w) / 2, -(1 + cos_w), (1 + cos_w) / 2)
+    return b, (1 + alpha, -2 * cos_w, 1 - alpha)
+
+def bandpass(center, sample_rate=44100, q=1.0):
+    # Constant 0 dB peak gain
+    cos_w, alpha = _rbj(center, sample_rate, q)
+    return (alpha, 0.0, -alpha), (1 + alpha, -2 * cos_w, 1 - alpha)
+
+def _state_space(b, a):
+    # Transposed direct form II as s' = A s + B x, y = C s + D x
+    b, a = np.asarray(b, dtype=float), np.asarray(a, dtype=float)
+    order = max(len(a), len(b)) - 1
+    b = np.pad(b, (0, order + 1 - len(b))) / a[0]
+    a = np.pad(a, (0, order + 1 - len(a))) / a[0]
+    A = np.eye(order, k=1)
+    A[:, 0] -= a[1:]
+    B = b[1:] - a[1:] * b[0]
+    return A, B, b[0]
+
+@lru_cache(maxsize=64)
+def _block_mats(b, a, length):
+    """Per-block response matrices for a filter, so a block of length samples is:
+
+        y     = x @ T + s_start @ O
+        s_end = s_start @ P.T + x @ Q
+    """
+    A, B, D = _state_space(b, a)
+    order = len(B)
+    powers = [np.eye(order)]
+    for _ in range(length):
+        powers.append(A @ powers[-1])
+    h = np.array([D] + [(powers[n] @ B)[0] for n in range(length - 1)])
+    idx = np.arange(length)
+    lag = idx[None, :] - idx[:, None]
+    T = np.where(lag >= 0, h[np.clip(lag, 0, None)], 0.0)
+    O = np.array([powers[n][0] for n in range(length)]).T.reshape(order, length)
+    Q = np.array([powers[length - 1 - k] @ B for k in range(length)]).reshape(length, order)
+    return T, O, Q, powers[length]
+
+def _scan_states(u, P, zi):
+    # End-of-block states e_j = P e_(j-1) + u_j with e_(-1) = zi, as a
+    # Hillis-Steele prefix scan: log2(blocks) vectorized steps instead of a loop
+    e = u.copy()
+    e[0] += P @ zi
+    step, Pd = 1, P
+    while step < len(e):
+        e[step:] = e[step:] + e[:-step] @ Pd.T
+        step, Pd = step * 2, Pd @ Pd
+    return e
+
+def lfilter(b, a, x, zi=None, block=BLOCK):
+    """Filter x with the IIR filter (b, a); returns (y, zf) like scipy.signal.lfilter.
+
+    The recursion runs on whole blocks at once: each block's zero-state output
+    is a matmul, and the states the blocks start from come from a parallel
+    scan. zi / zf are the filter state, so a long signal can be filtered in
+    pieces with zf of one piece passed as zi of the next.
+    """
+    b, a = tuple(map(float, b)), tuple(map(float, a))
+    x = np.asarray(x, dtype=float)
+    order = max(len(a), len(b)) - 1
+    zi = np.zeros(order) if zi is None else np.asarray(zi, dtype=float)
+    y = np.empty_like(x)
+    full = len(x) - len(x) % block
+    if full:
+        T, O, Q, P = _block_mats(b, a, block)
+        X = x[:full].reshape(-1, block)
+        ends = _scan_states(X @ Q, P, zi)
+        starts = np.vstack([zi[None, :], ends[:-1]])
+        y[:full] = (X @ T + starts @ O).ravel()
+        zi = ends[-1]
+    if full < len(x):
+        T, O, Q, P = _block_mats(b, a, len(x) - full)
+        tail = x[full:]
+        y[full:] = tail @ T + zi @ O
+        zi = P @ zi + tail @ Q
+    return y, zi
+
+class IIRFilter:
+    """Streaming wrapper around lfilter that keeps the state between blocks."""
+
+    def __init__(self, b, a):
+        self.b, self.a = b, a
+        self.reset()
+
+    def reset(self):
+        self.state = None
+
+    def process(self, block):
+        y, self.state = lfilter(self.b, self.a, block, self.state)
+        return y
@@ -0,0 +1,50 @@
+import numpy as np
+
+class Timeline:
+    """Single preallocated mix buffer that sounds are added into by sample offset.
+
+    With a duration the length is fixed and anything past the end is cut off,
+    like the scripts' min(idx + len, len(buffer)) clipping. Without one the
+    buffer grows geometrically, so appending n notes costs O(n) copies rather
+    than the O(n^2) of repeated np.concatenate.
+    """
+
+    def __init__(self, sample_rate=44100, duration=None, dtype=np.float32):
+        self.sample_rate = sample_rate
+        self.fixed = duration is not None
+        self.length = int(duration * sample_rate) if self.fixed else 0
+        self._buf = np.zeros(self.length if self.fixed else sample_rate, dtype=dtype)
+
+    def offset(self, seconds):
+        return int(seconds * self.sample_rate)
+
+    def _reserve(self, end):
+        if end <= len(self._buf): return
+        grown = np.zeros(max(end, 2 * len(self._buf)), dtype=self._buf.dtype)
+        grown[:self.length] = self._buf[:self.length]
+        self._buf = grown
+
+    def region(self, start, length):
+        # Writable view of [start, start + length); only valid until the next growth
+        end = start + length
+        if self.fixed:
+            end = min(end, self.length)
+        else:
+            self._reserve(end)
+            self.length = max(self.length, end)
+        return self._buf[start:end]
+
+    def add(self, samples, start, gain=1.0):
+        # Mix samples in at sample offset start; returns the number of samples kept
+        view = self.region(start, len(samples))
+        if gain == 1.0:
+            view += samples[:len(view)]
+        else:
+            view += samples[:len(view)] * gain
+        return len(view)
+
+    def append(self, samples, gain=1.0):
+        return self.add(samples, self.length, gain)
+
+    def mix(self):
+        return self._buf[:self.length]
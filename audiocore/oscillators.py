@@ -0,0 +1,72 @@
+import numpy as np
+
+TABLE_SIZE = 4096 # samples per cycle; linear interpolation error stays below ~1e-6
+LEVELS = 12 # level i keeps harmonics up to 2**i, i.e. one table per octave
+
+class Wavetable:
+    """One cycle of a periodic waveform, stored band-limited once per octave.
+
+    harmonics[k-1] is the amplitude of the k-th sine harmonic. Each voice
+    reads the richest level whose harmonics all stay below Nyquist at its
+    pitch, so saws and squares do not alias however high they are played.
+    """
+
+    def __init__(self, harmonics, size=TABLE_SIZE):
+        harmonics = np.asarray(harmonics, dtype=float)
+        self.size = size
+        self.tables = np.empty((LEVELS, size + 1)) # one guard sample for interpolation
+        for level in range(LEVELS):
+            spectrum = np.zeros(size // 2 + 1, dtype=complex)
+            keep = harmonics[:min(2 ** level, size // 2 - 1)]
+            spectrum[1:len(keep) + 1] = -0.5j * size * keep
+            self.tables[level, :size] = np.fft.irfft(spectrum, size)
+        self.tables[:, size] = self.tables[:, 0]
+
+    def level(self, freq, sample_rate):
+        # Richest table with no harmonic above Nyquist at freq
+        highest = 0.5 * sample_rate / np.maximum(np.abs(freq), 1e-9)
+        return np.clip(np.floor(np.log2(np.maximum(highest, 1.0))), 0, LEVELS - 1).astype(np.intp)
+
+    def lookup(self, phase, level):
+        # phase in cycles (any real value), level broadcastable against it
+        pos = (phase % 1.0) * self.size
+        i = pos.astype(np.intp)
+        lo = self.tables[level, i]
+        return lo + (self.tables[level, i + 1] - lo) * (pos - i)
+
+    def at(self, freq, t, sample_rate=44100):
+        """The waveform at freq Hz over times t (seconds): a drop-in for np.sin(2 * np.pi * freq * t).
+
+        freq may be a scalar or a column of voices ((K, 1) gives (K, len(t))).
+        """
+        freq = np.asarray(freq, dtype=float)
+        return self.lookup(freq * t, self.level(freq, sample_rate))
+
+    def sample(self, freq, n, sample_rate=44100):
+        return self.at(freq, np.arange(n) / sample_rate, sample_rate)
+
+_K = np.arange(1, TABLE_SIZE // 2)
+SINE = Wavetable([1.0])
+# Fourier series of the scripts' naive waves, e.g. get_saw's 2 * (x - floor(0.5 + x))
+SAW = Wavetable(2 / np.pi * (-1.0) ** (_K + 1) / _K)
+SQUARE = Wavetable(np.where(_K % 2 == 1, 4 / np.pi / _K, 0.0))
+
+class OscillatorBank:
+    """Phase accumulators for many voices reading one wavetable.
+
+    read(n) returns the next n samples of every voice as a (voices, n) array
+    and advances each phase, so long notes can be produced block by block.
+    """
+
+    def __init__(self, table, freqs, sample_rate=44100, phase=0.0):
+        self.table = table
+        self.freqs = np.atleast_1d(np.asarray(freqs, dtype=float))
+        self.sample_rate = sample_rate
+        self.phase = np.broadcast_to(np.asarray(phase, dtype=float), self.freqs.shape).copy()
+        self.levels = table.level(self.freqs, sample_rate)[:, None]
+
+    def read(self, n):
+        steps = self.freqs[:, None] * (np.arange(n) / self.sample_rate)
+        out = self.table.lookup(self.phase[:, None] + steps, self.levels)
+        self.phase = (self.phase + self.freqs * (n / self.sample_rate)) % 1.0
+        return out
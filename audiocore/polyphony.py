@@ -0,0 +1,68 @@
+import numpy as np
+
+RELEASE = 256 # samples a stolen voice takes to fade out (~6 ms at 44.1 kHz)
+
+class VoiceAllocator:
+    """Caps how many notes of one instrument sound at once.
+
+    note_on() is called in start order. Once max_voices notes are still
+    sounding, the oldest ones are stolen: the caller fades each out over
+    release samples from the new note's start.
+    """
+
+    def __init__(self, max_voices, release=RELEASE):
+        self.max_voices = max_voices
+        self.release = release
+        self.sounding = [] # [end sample, voice handle] in start order
+
+    def note_on(self, start, end, voice):
+        # Returns the handles of the voices stolen to make room
+        self.sounding = [s for s in self.sounding if s[0] > start]
+        stolen = []
+        while len(self.sounding) >= self.max_voices:
+            stolen.append(self.sounding.pop(0)[1])
+        self.sounding.append([end, voice])
+        return stolen
+
+class Chord:
+    """Notes of one instrument starting on the same sample with the same length
+    and velocity, mixed as a single (notes, samples) block.
+
+    sources are voice buffers, or stream readers (one per chord) for voices
+    synthesized block by block.
+    """
+
+    __slots__ = ("rank", "number", "start", "velocity", "sources", "ends", "cuts")
+
+    def __init__(self, rank, number, start, velocity):
+        self.rank, self.number, self.start, self.velocity = rank, number, start, velocity
+        self.sources, self.ends, self.cuts = [], [], []
+
+    def add(self, source, end):
+        self.sources.append(source)
+        self.ends.append(end)
+        self.cuts.append(None)
+        return len(self.sources) - 1
+
+    def steal(self, row, cut, release):
+        self.cuts[row] = (cut, release)
+        self.ends[row] = min(self.ends[row], cut + release)
+
+    @property
+    def end(self):
+        return max(self.ends)
+
+    def mix(self, out, b0, b1):
+        # Add this chord's samples in [b0, b1) to out, which starts at sample b0
+        lo, hi = max(self.start, b0), min(self.end, b1)
+        if hi <= lo: return
+        if isinstance(self.sources[0], np.ndarray):
+            rows = [s[lo - self.start:hi - self.start] for s in self.sources]
+        else:
+            rows = [read(hi - lo) for read in self.sources]
+        if any(cut is not None for cut in self.cuts):
+            pos = np.arange(lo, hi)
+            rows = [r if cut is None else r * np.clip((cut[0] + cut[1] - pos) / cut[1], 0, 1)
+                    for r, cut in zip(rows, self.cuts)]
+        v = rows[0] if len(rows) == 1 else np.stack(rows).sum(axis=0)
+        out[lo - b0:hi - b0] += v if self.velocity == 1.0 else v * self.velocity
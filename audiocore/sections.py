@@ -0,0 +1,64 @@
+import hashlib
+import os
+import numpy as np
+
+from rendercore.workspace import save_array
+
+from .sequencer import BLOCK
+
+def _describe(inst):
+    synth = lambda f: f and (f.__module__, f.__qualname__)
+    return (synth(inst.synth), synth(inst.stream), inst.pitched, inst.vectorized, inst.cached, inst.overhang,
+            inst.polyphony, sorted(inst.params.items()))
+
+def _event(e):
+    # Plain floats, so 0.5 and np.float64(0.5) hash alike
+    pitch = None if e.pitch is None else float(e.pitch)
+    return float(e.start), float(e.duration), e.instrument, pitch, float(e.velocity)
+
+class SectionCache:
+    """Content-addressed disk cache of rendered sections, one float32 .npy each.
+
+    The key hashes everything a section's samples depend on: its events and
+    duration (and so the section's params and tempo), the sample rate, each
+    instrument's synth and parameters, and version. Synth code is not
+    hashed; bump version whenever it changes. Identical sections, within a
+    track or across runs, are rendered once; noise in them repeats. A
+    section edited or re-voiced gets a new key, and its old .npy is left
+    behind; clear cache_dir after synth changes.
+    """
+
+    def __init__(self, cache_dir, version=1):
+        self.cache_dir = cache_dir
+        self.version = version
+        self.hits = self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, sequencer, events, duration):
+        names = sorted({e.instrument for e in events})
+        parts = (self.version, sequencer.sample_rate, float(duration),
+                 [(name, _describe(sequencer.instruments[name])) for name in names], [_event(e) for e in events])
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.npy")
+
+    def section(self, sequencer, events, duration, block=BLOCK):
+        """The section's float32 samples, loaded if it was rendered before and stored if not."""
+        path = self.path(self.key(sequencer, events, duration))
+        if os.path.exists(path):
+            self.hits += 1
+            return np.load(path)
+        self.misses += 1
+        buffer = np.empty(int(duration * sequencer.sample_rate), dtype=np.float32)
+        pos = 0
+        for out in sequencer.blocks(events, duration, block):
+            buffer[pos:pos + len(out)] = out
+            pos += len(out)
+        save_array(path, buffer) # stems on other processes may be loading it
+        return buffer
+
+    def stream(self, sequencer, events, writer, duration, block=BLOCK):
+        # Sequencer.stream() through the cache: the section is held whole and
+        # goes out in one write, which the writer splits into CHUNKs itself
+        writer.write(self.section(sequencer, events, duration, block))
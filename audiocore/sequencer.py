@@ -0,0 +1,171 @@
+from collections import namedtuple
+import numpy as np
+
+from .mixer import Timeline
+from .polyphony import Chord, VoiceAllocator
+from .voices import VoiceCache
+
+BLOCK = 4096 # samples per streamed block
+
+# start / duration in seconds; pitch in Hz (None for unpitched voices); velocity is a gain
+Event = namedtuple("Event", "start duration instrument pitch velocity", defaults=(None, 1.0))
+
+class Instrument:
+    """How the sequencer turns events into samples.
+
+    synth(pitch, duration, sample_rate=..., **params) returns one voice, or
+    synth(duration, sample_rate=..., **params) when pitched=False. A vectorized
+    synth also accepts a (K, 1) column of pitches and returns (K, n) voices,
+    so every note of one length is synthesized in a single call. Identical
+    voices are synthesized once unless cached=False (noise). Notes running past
+    the end of the output are cut there; with overhang="drop" only notes that
+    end before the end of the output are played. polyphony caps how many of
+    the instrument's notes sound at once; extra notes steal the oldest voice.
+
+    stream is an optional block-wise version of synth for long voices (rain
+    beds, drones): called with the same arguments, it returns read(n), which
+    gives the voice's next n samples. Streamed renders use it so a voice is
+    never held in memory whole.
+    """
+
+    def __init__(self, synth, pitched=True, vectorized=False, cached=True, overhang="cut", stream=None,
+                 polyphony=None, **params):
+        self.synth = synth
+        self.polyphony = polyphony
+        self.stream = stream
+        self.pitched = pitched
+        self.vectorized = vectorized and pitched
+        self.cached = cached
+        self.overhang = overhang
+        self.params = params
+
+    def _args(self, pitch, duration):
+        return (pitch, duration) if self.pitched else (duration,)
+
+    def reader(self, event, sample_rate):
+        return self.stream(*self._args(event.pitch, event.duration), sample_rate=sample_rate, **self.params)
+
+    def voices(self, events, sample_rate, cache):
+        # One buffer per event, in event order; identical notes share a buffer
+        if not self.cached:
+            return [self.synth(*self._args(e.pitch, e.duration), sample_rate=sample_rate, **self.params)
+                    for e in events]
+        if not self.vectorized:
+            return [cache.get(self.synth, *self._args(e.pitch, e.duration), sample_rate=sample_rate,
+                              **self.params) for e in events]
+        keys = [cache.key(self.synth, e.pitch, e.duration, sample_rate=sample_rate, **self.params)
+                for e in events]
+        found, missing = {}, {}
+        for e, key in zip(events, keys):
+            if key in found or key in missing.get(e.duration, {}): continue
+            voice = cache.find(key)
+            if voice is None:
+                missing.setdefault(e.duration, {})[key] = e.pitch
+            else:
+                found[key] = voice
+        for duration, pitches in missing.items():
+            column = np.array(list(pitches.values()), dtype=float)[:, None]
+            rows = self.synth(column, duration, sample_rate=sample_rate, **self.params)
+            rows = np.broadcast_to(rows, (len(column), rows.shape[-1]))
+            for key, row in zip(pitches, rows):
+                found[key] = cache.put(key, row.copy())
+        return [found[key] for key in keys]
+
+class Sequencer:
+    """Renders (start, duration, instrument, pitch, velocity) events into a mix bus.
+
+    Events are grouped by instrument (in the order the instruments were
+    given) and each group's voices are synthesized in batches. Notes of an
+    instrument that start together become one Chord, summed as a 2-D block,
+    and are pasted at int(start * sample_rate) like the old per-note loops.
+    """
+
+    def __init__(self, instruments, sample_rate=44100, cache=None):
+        self.instruments = instruments
+        self.sample_rate = sample_rate
+        self.cache = cache or VoiceCache()
+
+    def _pending(self, events, total):
+        # (start sample, instrument rank, event number, event), in start order
+        rank = {name: i for i, name in enumerate(self.instruments)}
+        return sorted(((int(e.start * self.sample_rate), rank[e.instrument], n, e) for n, e in enumerate(events)
+                       if int(e.start * self.sample_rate) < total), key=lambda p: p[:3])
+
+    def _allocators(self):
+        return {r: VoiceAllocator(inst.polyphony) for r, inst in enumerate(self.instruments.values())
+                if inst.polyphony}
+
+    def _start_chords(self, starting, total, allocators):
+        # Synthesize the notes in starting (in start order), batched per instrument,
+        # gather them into chords and let each instrument's allocator steal voices
+        by_rank = {}
+        for idx, r, n, e in starting:
+            by_rank.setdefault(r, []).append((idx, n, e))
+        started = []
+        for r, group in by_rank.items():
+            inst = self.instruments[group[0][2].instrument]
+            if inst.stream is not None:
+                sources = [inst.reader(e, self.sample_rate) for _, _, e in group]
+                lengths = [int(e.duration * self.sample_rate) for _, _, e in group]
+            else:
+                sources = inst.voices([e for _, _, e in group], self.sample_rate, self.cache)
+                lengths = [len(v) for v in sources]
+            chords = {}
+            for (idx, n, e), source, length in zip(group, sources, lengths):
+                if inst.overhang == "drop" and idx + length >= total: continue
+                key = (idx, length, e.velocity) if inst.stream is None else n
+                if key not in chords:
+                    chords[key] = Chord(r, n, idx, e.velocity)
+                    started.append(chords[key])
+                chord = chords[key]
+                row = chord.add(source, min(idx + length, total))
+                if r in allocators:
+                    for old, old_row in allocators[r].note_on(idx, chord.ends[row], (chord, row)):
+                        old.steal(old_row, idx, allocators[r].release)
+        return started
+
+    def render_into(self, out, events):
+        # Mix events into out (event times are relative to out[0])
+        chords = self._start_chords(self._pending(events, len(out)), len(out), self._allocators())
+        for chord in sorted(chords, key=lambda c: (c.rank, c.number)):
+            chord.mix(out, 0, len(out))
+        return out
+
+    def render(self, events, duration=None):
+        # Whole arrangement as one float32 buffer, by default as long as its last note
+        if duration is None:
+            duration = max((e.start + e.duration for e in events), default=0.0)
+        timeline = Timeline(self.sample_rate, duration)
+        self.render_into(timeline.mix(), events)
+        return timeline.mix()
+
+    def blocks(self, events, duration, block=BLOCK):
+        """Render duration seconds as a generator of float32 blocks.
+
+        Only chords sounding in the current block are mixed, each block is
+        yielded as soon as it is done, and instruments with a stream reader
+        are synthesized incrementally, so memory is bounded by the block size
+        and the longest plain voice, not by the track length. Samples match
+        render(): every chord is summed in the same order.
+        """
+        total = int(duration * self.sample_rate)
+        pending = self._pending(events, total)[::-1]
+        allocators = self._allocators()
+        active = []
+        for b0 in range(0, total, block):
+            b1 = min(b0 + block, total)
+            starting = []
+            while pending and pending[-1][0] < b1:
+                starting.append(pending.pop())
+            active.extend(self._start_chords(starting, total, allocators))
+            active.sort(key=lambda c: (c.rank, c.number))
+            out = np.zeros(b1 - b0, dtype=np.float32)
+            for chord in active:
+                chord.mix(out, b0, b1)
+            active = [c for c in active if c.end > b1]
+            yield out
+
+    def stream(self, events, writer, duration, block=BLOCK):
+        # blocks() written one by one into writer.write(), e.g. a WavWriter
+        for out in self.blocks(events, duration, block):
+            writer.write(out)
@@ -0,0 +1,141 @@
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+from .sequencer import BLOCK
+from .wav import CHUNK, WavReader, WavWriter
+
+_worker = {}
+
+def stem_path(stem_dir, name):
+    return os.path.join(stem_dir, f"{name}.wav")
+
+def render_stem(sequencer, sections, instruments, path, seed=None, cache=None):
+    """Stream the events of the given instruments, section after section, to a float32 WAV.
+
+    sections is a list of (duration seconds, events), played back to back.
+    seed reseeds np.random first, so noise voices are reproducible per stem.
+    With a SectionCache, sections rendered before are loaded, not synthesized.
+    The stem is written unclipped; only the final mix is clipped, as if every
+    instrument had been summed on one bus.
+    """
+    if seed is not None:
+        np.random.seed(seed)
+    with WavWriter(path, sequencer.sample_rate, fmt="float32", clip=False) as wav:
+        for duration, events in sections:
+            events = [e for e in events if e.instrument in instruments]
+            if cache is None:
+                sequencer.stream(events, wav, duration)
+            else:
+                cache.stream(sequencer, events, wav, duration)
+    return path
+
+def _stem_blocks(sequencer, sections, instruments, cache, block=BLOCK):
+    # One stem's samples, section after section, as BLOCK-sized pieces
+    for duration, events in sections:
+        events = [e for e in events if e.instrument in instruments]
+        if cache is None:
+            yield from sequencer.blocks(events, duration, block)
+        else:
+            samples = cache.section(sequencer, events, duration, block)
+            for b0 in range(0, len(samples), block):
+                yield samples[b0:b0 + block]
+
+def _seeded(blocks, seed, chunk):
+    # Runs a block generator on its own np.random state, seeded as render_stem
+    # seeds it, and yields its blocks joined into pieces of at least chunk
+    # frames; the state is swapped in once per piece, not once per block
+    np.random.seed(seed)
+    state = np.random.get_state()
+    while True:
+        np.random.set_state(state)
+        piece, frames = [], 0
+        for block in blocks:
+            piece.append(block)
+            frames += len(block)
+            if frames >= chunk: break
+        state = np.random.get_state()
+        if not piece: return
+        yield np.concatenate(piece)
+
+def mix_sequenced(sequencer, sections, stems, seeds, out_path, fmt="int16", cache=None, chunk=CHUNK):
+    """Render the stems in lockstep and sum them in memory into out_path, with no stem files.
+
+    Every stem keeps its own np.random state, so the mix is the one
+    mix_stems makes from render_stem's files with the same seeds; memory
+    is bounded by about chunk frames per stem, as when streaming.
+    """
+    streams = [_seeded(_stem_blocks(sequencer, sections, set(instruments), cache), seeds[name], chunk)
+               for name, instruments in stems.items()]
+    with WavWriter(out_path, sequencer.sample_rate, fmt=fmt) as wav:
+        for pieces in zip(*streams):
+            out = np.zeros(len(pieces[0]), dtype=np.float32)
+            for piece in pieces:
+                out += piece
+            wav.write(out)
+    return out_path
+
+def _init_worker(sequencer, sections, cache):
+    # The arrangement is shipped once per process, not once per stem
+    _worker.update(sequencer=sequencer, sections=sections, cache=cache)
+
+def _render_stem_job(job):
+    instruments, path, seed = job
+    return render_stem(_worker["sequencer"], _worker["sections"], instruments, path, seed, _worker["cache"])
+
+def mix_stems(paths, out_path, sample_rate=44100, fmt="int16", block=CHUNK):
+    # Sum stem files block by block, in the given order; the writer clips the mix
+    readers = [WavReader(p) for p in paths]
+    total = max(r.frames for r in readers)
+    try:
+        with WavWriter(out_path, sample_rate, fmt=fmt) as wav:
+            for b0 in range(0, total, block):
+                out = np.zeros(min(block, total - b0), dtype=np.float32)
+                for r in readers:
+                    samples = r.read(len(out))
+                    out[:len(samples)] += samples
+                wav.write(out)
+    finally:
+        for r in readers:
+            r.close()
+    return out_path
+
+def render_stems(sequencer, sections, stems, out_path, stem_dir=None, only=None, workers=None, fmt="int16",
+                 cache=None):
+    """Render each stem of an arrangement in its own process, then mix them into out_path.
+
+    stems maps a stem name to the instruments it plays, e.g.
+    {"drums": ["kick", "snare"], "bass": ["wobble"]}. Stems are kept as
+    float32 WAVs in stem_dir (a temporary directory when None); with only,
+    just those stems are re-rendered and the other files in stem_dir reused.
+    workers=None uses one process per stem, capped at the core count;
+    workers=1 renders them in-process, and without a stem_dir sums them in
+    memory (mix_sequenced) instead of writing stem files. Each stem gets its
+    own seed, drawn from np.random in stem order, so the mix does not depend
+    on workers. cache is an optional SectionCache shared by every stem.
+    """
+    seeds = dict(zip(stems, np.random.randint(2 ** 31, size=len(stems))))
+    if stem_dir is None and (workers or os.cpu_count() or 1) == 1:
+        return mix_sequenced(sequencer, sections, stems, seeds, out_path, fmt, cache)
+    keep = stem_dir is not None
+    stem_dir = stem_dir or tempfile.mkdtemp(prefix="stems-")
+    os.makedirs(stem_dir, exist_ok=True)
+    paths = [stem_path(stem_dir, name) for name in stems]
+    jobs = [(set(stems[name]), path, int(seeds[name])) for name, path in zip(stems, paths)
+            if only is None or name in only or not os.path.exists(path)]
+    workers = min(workers or os.cpu_count() or 1, len(jobs) or 1)
+    try:
+        if workers == 1:
+            for job in jobs:
+                render_stem(sequencer, sections, *job, cache)
+        else:
+            with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(sequencer, sections, cache)) as pool:
+                list(pool.map(_render_stem_job, jobs))
+        return mix_stems(paths, out_path, sequencer.sample_rate, fmt)
+    finally:
+        if not keep:
+            for path in paths:
+                if os.path.exists(path):
+                    os.remove(path)
+            os.rmdir(stem_dir)
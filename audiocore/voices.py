@@ -0,0 +1,45 @@
+from collections import OrderedDict
+
+class VoiceCache:
+    """LRU cache of synthesized voices, keyed on (generator, args, params).
+
+    Only for deterministic generators: a cached noise hit would repeat the
+    same noise on every hit. Cached buffers are read-only; mix them into a
+    buffer, never modify them in place.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._voices = OrderedDict()
+
+    @staticmethod
+    def key(generator, *args, **params):
+        return (generator.__module__, generator.__qualname__, args, tuple(sorted(params.items())))
+
+    def find(self, key):
+        # Cached voice for key (refreshing its LRU slot), or None
+        voice = self._voices.get(key)
+        if voice is None:
+            self.misses += 1
+            return None
+        self._voices.move_to_end(key)
+        self.hits += 1
+        return voice
+
+    def put(self, key, voice):
+        voice.setflags(write=False)
+        self._voices[key] = voice
+        if len(self._voices) > self.maxsize:
+            self._voices.popitem(last=False)
+        return voice
+
+    def get(self, generator, *args, **params):
+        key = self.key(generator, *args, **params)
+        voice = self.find(key)
+        if voice is None:
+            voice = self.put(key, generator(*args, **params))
+        return voice
+
+    def clear(self):
+        self._voices.clear()
@@ -0,0 +1,143 @@
+import struct
+import numpy as np
+
+CHUNK = 1 << 16 # frames per write; big enough that per-call overhead vanishes
+
+# format name -> (bytes per sample, WAVE format tag)
+FORMATS = {"int16": (2, 1), "int24": (3, 1), "float32": (4, 3)}
+
+def to_pcm(samples, fmt="int16", clip=True):
+    """Float samples in [-1, 1] (clipped) to little-endian PCM bytes.
+
+    Integer formats scale by the positive full-scale value and truncate toward
+    zero, the same as the scripts' old (x * 32767).astype(np.int16).
+    clip=False keeps float32 samples outside [-1, 1], e.g. for stems that
+    are summed before the final mix is clipped.
+    """
+    x = np.asarray(samples)
+    if clip or fmt != "float32":
+        x = np.clip(x, -1, 1)
+    if fmt == "int16":
+        return (x * 32767).astype("<i2").tobytes()
+    if fmt == "int24":
+        wide = (x.astype(np.float64) * 8388607).astype("<i4")
+        return wide.view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+    if fmt == "float32":
+        return x.astype("<f4").tobytes()
+    raise ValueError(f"unknown sample format {fmt!r}")
+
+class WavWriter:
+    """Streaming WAV file writer: write() float blocks, sizes are patched on close.
+
+    Nothing but the current block is held in memory, so tracks of any length
+    (up to the 4 GiB RIFF limit) can be written block by block.
+    """
+
+    def __init__(self, path, sample_rate=44100, channels=1, fmt="int16", clip=True):
+        if fmt not in FORMATS:
+            raise ValueError(f"unknown sample format {fmt!r}")
+        self.sample_rate, self.channels, self.fmt, self.clip = sample_rate, channels, fmt, clip
+        self.width, self.tag = FORMATS[fmt]
+        self.frames = 0
+        self.f = open(path, "wb")
+        self._write_header()
+
+    def _write_header(self):
+        block_align = self.channels * self.width
+        data_bytes = self.frames * block_align
+        pad = data_bytes % 2 # RIFF chunks are word aligned
+        fmt_chunk = struct.pack("<HHIIHH", self.tag, self.channels, self.sample_rate,
+                                self.sample_rate * block_align, block_align, self.width * 8)
+        extra = b""
+        if self.tag != 1:
+            # Non-PCM formats carry a cbSize field and a fact chunk with the frame count
+            fmt_chunk += struct.pack("<H", 0)
+            extra = b"fact" + struct.pack("<II", 4, self.frames)
+        header = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt_chunk)) + fmt_chunk + extra
+        self.f.seek(0)
+        self.f.write(b"RIFF" + struct.pack("<I", len(header) + 8 + data_bytes + pad) + header)
+        self.f.write(b"data" + struct.pack("<I", data_bytes))
+
+    def write(self, samples):
+        # samples: (frames,) for mono or (frames, channels), floats in [-1, 1]
+        samples = np.asarray(samples)
+        for start in range(0, len(samples), CHUNK):
+            self.f.write(to_pcm(samples[start:start + CHUNK], self.fmt, self.clip))
+        self.frames += len(samples)
+
+    def close(self):
+        if self.f.closed: return
+        if (self.frames * self.channels * self.width) % 2:
+            self.f.write(b"\0")
+        self._write_header()
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def from_pcm(data, fmt="int16"):
+    # Inverse of to_pcm: little-endian PCM bytes to float64 samples
+    if fmt == "int16":
+        return np.frombuffer(data, "<i2") / 32767
+    if fmt == "int24":
+        raw = np.frombuffer(data, np.uint8).reshape(-1, 3).astype(np.int32)
+        wide = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        return np.where(wide >= 1 << 23, wide - (1 << 24), wide) / 8388607
+    if fmt == "float32":
+        return np.frombuffer(data, "<f4").astype(float)
+    raise ValueError(f"unknown sample format {fmt!r}")
+
+class WavReader:
+    """Block-wise reader for the WAV files WavWriter produces (and other PCM WAVs).
+
+    read(n) returns up to n frames as floats, (frames,) for mono or
+    (frames, channels), and an empty array at the end of the data.
+    """
+
+    def __init__(self, path):
+        self.f = open(path, "rb")
+        riff, _, wave = struct.unpack("<4sI4s", self.f.read(12))
+        if riff != b"RIFF" or wave != b"WAVE":
+            raise ValueError(f"{path} is not a WAV file")
+        while True:
+            head = self.f.read(8)
+            if len(head) < 8:
+                raise ValueError(f"{path} has no data chunk")
+            chunk, size = struct.unpack("<4sI", head)
+            if chunk == b"fmt ":
+                tag, self.channels, self.sample_rate, _, _, bits = struct.unpack("<HHIIHH", self.f.read(16))
+                self.f.seek(size - 16 + size % 2, 1)
+            elif chunk == b"data":
+                break
+            else:
+                self.f.seek(size + size % 2, 1)
+        self.fmt = {(1, 16): "int16", (1, 24): "int24", (3, 32): "float32"}[tag, bits]
+        self.width = FORMATS[self.fmt][0]
+        self.frames = size // (self.width * self.channels)
+        self.remaining = self.frames
+
+    def read(self, n):
+        n = min(n, self.remaining)
+        self.remaining -= n
+        samples = from_pcm(self.f.read(n * self.width * self.channels), self.fmt)
+        return samples if self.channels == 1 else samples.reshape(-1, self.channels)
+
+    def close(self):
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def write_wav(path, samples, sample_rate=44100, fmt="int16"):
+    """Write a whole float buffer ((frames,) or (frames, channels)) and return path."""
+    samples = np.asarray(samples)
+    channels = 1 if samples.ndim == 1 else samples.shape[1]
+    with WavWriter(path, sample_rate, channels, fmt) as w:
+        w.write(samples)
+    return path
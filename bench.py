@@ -0,0 +1,173 @@
+"""Benchmark every render_*.py and compose_*.py script and write the timings as JSON.
+
+Each case runs in its own process with fixed seeds, inside a throwaway
+workspace (ARIA_WORKSPACE) holding copies of the repo's textures, so nothing
+touches /home/claw and no network is needed. Scenes built on rendercore run
+at "reduced" (quarter) or "standard" size, and the audio generators at
+"reduced" (quarter) or full length; the other scripts have a fixed size.
+
+    python bench.py --size reduced --out bench.json
+    python bench.py --size standard --compare bench.json
+"""
+import argparse
+import importlib
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Sized rendercore scenes: entry point and standard (width, height)
+SCENES = {
+    "render_2k": ("render_cinematic_2k", 2560, 1080),
+    "render_v4": ("render_cinematic_v4", 1260, 540),
+    "render_final_cinematic": ("render_cinematic_final", 1260, 540),
+    "render_cinematic": ("render_aria_cinematic", 1260, 540),
+    "render_aria_forest": ("render_aria_forest", 800, 800),
+    "render_aria_textured": ("render_aria_textured", 800, 800),
+    "render_aria_tpose": ("render_aria_tpose", 800, 800),
+    "render_box": ("render_box_scene", 800, 800),
+    "render_box_v2": ("render_box_scene_v2", 800, 800),
+    "render_house": ("render_3d_house", 800, 800),
+}
+
+# Fixed-size scripts and audio generators: entry point only
+SCRIPTS = {
+    "render_aria_pose": "render_minecraft_aria",
+    "render_aria_pose_v2": "render_minecraft_aria_v2",
+    "render_feeling": "render_aria_inner_peace",
+    "render_earth": "render_space_scene",
+    "render_landscape": "render_mountain_landscape",
+    "render_mc": "create_minecraft_scene",
+    "render_soul": "render_aria_soul",
+    "render_senpai_rest": "render",
+    "compose_song": "create_melody",
+    "compose_sad_song": "create_sad_piano",
+    "compose_dubstep": "create_dubstep",
+}
+
+# Inputs the scripts read from the workspace; copied, not linked, so outputs
+# that share a name with a checked-in file can never overwrite it
+ASSETS = ("aria05_skin.png", "aria05_alex.png", "imnotdanish05_skin.png", "sky_texture.jpg", "sky_v4.jpg")
+SEED = 1234
+# Generators that render stems on a process pool unless told workers=1
+POOLED = ("compose_sad_song", "compose_dubstep")
+# Quarter-length keyword arguments for the generators at --size reduced;
+# compose_song writes one fixed 7 s melody
+REDUCED = {
+    "compose_sad_song": lambda mod: {"total_sec": 30},
+    "compose_dubstep": lambda mod: {"sections": [dict(sec, dur=sec["dur"] // 4) for sec in mod.SECTIONS]},
+}
+
+def make_workspace():
+    ws = tempfile.mkdtemp(prefix="aria-bench-")
+    for name in ASSETS:
+        if os.path.exists(os.path.join(ROOT, name)):
+            shutil.copy(os.path.join(ROOT, name), ws)
+    return ws
+
+def wav_frames(path):
+    with wave.open(path) as f:
+        return f.getnframes()
+
+def run_case(name, size):
+    # Runs in the child process; returns one result record
+    random.seed(SEED)
+    np.random.seed(SEED)
+    sys.path.insert(0, ROOT)
+    mod = importlib.import_module(name)
+    result = {"name": name, "kind": "audio" if name.startswith("compose_") else "image"}
+    if name in SCENES:
+        entry, width, height = SCENES[name]
+        if size == "reduced":
+            width, height = width // 4, height // 4
+        start = time.perf_counter()
+        getattr(mod, entry)(width, height, workers=1)
+        wall = time.perf_counter() - start
+        result.update(width=width, height=height, rays_per_s=width * height / wall)
+    else:
+        # in-process, so the stems' memory shows up in RUSAGE_SELF below
+        kwargs = {"workers": 1} if name in POOLED else {}
+        if size == "reduced" and name in REDUCED:
+            kwargs.update(REDUCED[name](mod))
+        start = time.perf_counter()
+        out = getattr(mod, SCRIPTS[name])(**kwargs)
+        wall = time.perf_counter() - start
+        if result["kind"] == "audio":
+            samples = wav_frames(out)
+            result.update(samples=samples, samples_per_s=samples / wall)
+    # ru_maxrss is in KiB on Linux
+    result.update(wall_s=wall, peak_mem_mb=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)
+    return result
+
+def spawn_case(name, size, ws):
+    env = dict(os.environ, ARIA_WORKSPACE=ws)
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--case", name, "--size", size],
+                          cwd=ws, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        return {"name": name, "error": proc.stderr.strip().splitlines()[-1:]}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+def compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = {r["name"]: r for r in json.load(f)["results"]}
+    for r in results:
+        old = baseline.get(r["name"])
+        if not old or "wall_s" not in old or "wall_s" not in r: continue
+        print(f"{r['name']:24s} {old['wall_s']:8.2f}s -> {r['wall_s']:8.2f}s  x{old['wall_s'] / r['wall_s']:.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the render_*.py and compose_*.py scripts")
+    parser.add_argument("names", nargs="*", help="cases to run (default: all)")
+    parser.add_argument("--size", choices=("reduced", "standard"), default="reduced")
+    parser.add_argument("--out", help="write results JSON here")
+    parser.add_argument("--compare", metavar="JSON", help="print speedups against an earlier results file")
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        result = run_case(args.case, args.size)
+        print(json.dumps(result))
+        return
+
+    names = args.names or list(SCENES) + list(SCRIPTS)
+    ws = make_workspace()
+    results = []
+    try:
+        for name in names:
+            r = spawn_case(name, args.size, ws)
+            results.append(r)
+            if "error" in r:
+                print(f"{name:24s} FAILED {' '.join(r['error'])}")
+            else:
+                print(f"{name:24s} {r['wall_s']:8.2f}s {r['peak_mem_mb']:8.1f} MB")
+    finally:
+        shutil.rmtree(ws, ignore_errors=True)
+
+    report = {"commit": git_commit(), "size": args.size, "python": platform.python_version(),
+              "numpy": np.__version__, "cpu_count": os.cpu_count(), "results": results}
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,21 @@
 import numpy as np
-import wave
-import struct
 import time
 import random
 
+from audiocore import SINE, Event, IIRFilter, Instrument, Sequencer, Wavetable, lfilter, one_pole, render_stems
+from rendercore.workspace import workspace_path
+
+# Sad piano: rich harmonics but soft high-end
+PIANO = Wavetable([0.6, 0.3, 0.1])
+
 def get_sine(freq, duration, sample_rate=44100, amp=0.5):
     t = np.linspace(0, duration, int(sample_rate * duration), False)
-    return amp * np.sin(2 * np.pi * freq * t)
+    return amp * SINE.at(freq, t, sample_rate)
 
 def get_piano_note(freq, duration, sample_rate=44100, amp=0.4):
-    if freq == 0: return np.zeros(int(sample_rate * duration))
+    if np.all(freq == 0): return np.zeros(int(sample_rate * duration))
     t = np.linspace(0, duration, int(sample_rate * duration), False)
-    # Sad piano: rich harmonics but soft high-end
-    tone = np.sin(2 * np.pi * freq * t) * 0.6
-    tone += np.sin(2 * np.pi * (freq * 2) * t) * 0.3
-    tone += np.sin(2 * np.pi * (freq * 3) * t) * 0.1
+    tone = PIANO.at(freq, t, sample_rate)
     # Smooth attack and long release
     env = np.exp(-4 * t / duration)
     attack = np.minimum(1, t / 0.05) # 50ms attack
@@ -22,20 +23,39 @@ def get_piano_note(freq, duration, sample_rate=44100, amp=0.4):
 
 def get_rain_ambient(duration, sample_rate=44100, amp=0.08):
     noise = np.random.rand(int(sample_rate * duration)) * 2 - 1
-    # Simple low-pass filter simulation (muffled rain)
+    # Simple low-pass filter simulation (muffled rain); the first sample stays silent
     filtered_noise = np.zeros_like(noise)
     alpha = 0.1
-    for i in range(1, len(noise)):
-        filtered_noise[i] = alpha * noise[i] + (1 - alpha) * filtered_noise[i-1]
+    filtered_noise[1:], _ = lfilter(*one_pole(alpha), noise[1:])
     return filtered_noise * amp
 
-def create_sad_piano():
+def stream_rain_ambient(duration, sample_rate=44100, amp=0.08):
+    # get_rain_ambient one block at a time: same noise, filter state kept between blocks
+    lowpass = IIRFilter(*one_pole(0.1))
+    started = False
+    def read(n):
+        nonlocal started
+        noise = np.random.rand(n) * 2 - 1
+        if not started:
+            noise[0] = 0 # keeps the first output sample silent, as above
+            started = True
+        return lowpass.process(noise) * amp
+    return read
+
+STEMS = {"rain": ["rain"], "chords": ["chords"], "melody": ["melody"]}
+
+def create_sad_piano(total_sec=120, workers=None, stem_dir=None, only=None):
+    # Each stem streams to disk in blocks on its own process, so even hour-long
+    # loops run in constant memory; keep stem_dir to re-render only changed stems
     sr = 44100
     bpm = 65
     beat_dur = 60 / bpm
-    total_sec = 120 # 2 minutes
     
-    full_audio = np.zeros(int(total_sec * sr), dtype=np.float32)
+    sequencer = Sequencer({
+        "rain": Instrument(get_rain_ambient, pitched=False, cached=False, stream=stream_rain_ambient),
+        "chords": Instrument(get_piano_note, vectorized=True, polyphony=6, amp=0.15),
+        "melody": Instrument(get_piano_note, vectorized=True, polyphony=2, amp=0.25),
+    }, sr)
     
     # Frequencies
     notes = {
@@ -48,7 +68,7 @@ def create_sad_piano():
     print("Generating sad piano with ambient rain...")
     
     # 1. Add Rain Ambient (Background layer)
-    full_audio += get_rain_ambient(total_sec, sr)
+    events = [Event(0, total_sec, "rain")]
     
     # 2. Composition (Slow A minor / D minor vibe)
     # 4 Voices: Bass, Chord L, Chord R, Melody
@@ -66,36 +86,20 @@ def create_sad_piano():
         chord = chord_prog[bar % len(chord_prog)]
         
         # Draw Chords/Bass (Voices 1, 2, 3)
-        for i, note_name in enumerate(chord):
-            n_freq = notes[note_name]
-            note_audio = get_piano_note(n_freq, beat_dur * 4, sr, amp=0.15)
-            idx = int(start_time * sr)
-            end = min(idx + len(note_audio), len(full_audio))
-            full_audio[idx:end] += note_audio[:end-idx]
+        for note_name in chord:
+            events.append(Event(start_time, beat_dur * 4, "chords", notes[note_name]))
             
         # Draw Melody (Voice 4)
         for step in range(4):
             m_note = melody[(bar * 4 + step) % len(melody)]
             if m_note != '0':
-                m_freq = notes[m_note]
-                m_audio = get_piano_note(m_freq, beat_dur, sr, amp=0.25)
-                m_idx = int((start_time + step * beat_dur) * sr)
-                m_end = min(m_idx + len(m_audio), len(full_audio))
-                full_audio[m_idx:m_end] += m_audio[:m_end-m_idx]
+                events.append(Event(start_time + step * beat_dur, beat_dur, "melody", notes[m_note]))
 
-    # Normalize
-    full_audio = np.clip(full_audio, -1, 1)
-    full_audio = (full_audio * 32767).astype(np.int16)
-    
     timestamp = int(time.time())
-    filename = f"/home/claw/.openclaw/workspace/aria-sad-piano-{timestamp}.wav"
+    filename = workspace_path(f"aria-sad-piano-{timestamp}.wav")
     
-    with wave.open(filename, 'w') as f:
-        f.setnchannels(1)
-        f.setsampwidth(2)
-        f.setframerate(sr)
-        f.writeframes(full_audio.tobytes())
-            
+    # The mix is clipped to [-1, 1] as it is written
+    render_stems(sequencer, [(total_sec, events)], STEMS, filename, stem_dir, only, workers)
     print(f"MEDIA:{filename}")
     return filename
 
@@ -1,14 +1,15 @@
 import numpy as np
-import wave
-import struct
 import time
 
+from audiocore import Event, Instrument, Sequencer, Wavetable, write_wav
+from rendercore.workspace import workspace_path
+
+# Basic sine wave with harmonics for a more complex "piano-like" tone
+PIANO = Wavetable([0.5, 0.25, 0.125])
+
 def generate_piano_note(freq, duration, sample_rate=44100):
     t = np.linspace(0, duration, int(sample_rate * duration), False)
-    # Basic sine wave with harmonics for a more complex "piano-like" tone
-    tone = np.sin(2 * np.pi * freq * t) * 0.5
-    tone += np.sin(2 * np.pi * (freq * 2) * t) * 0.25
-    tone += np.sin(2 * np.pi * (freq * 3) * t) * 0.125
+    tone = PIANO.at(freq, t, sample_rate)
     
     # Exponential decay to sound like a plucked/hit string
     decay = np.exp(-3 * t / duration)
@@ -26,27 +27,18 @@ def create_melody():
     melody_sequence = ['C4', 'C4', 'G4', 'G4', 'A4', 'A4', 'G4', 'F4', 'F4', 'E4', 'E4', 'D4', 'D4', 'C4']
     note_duration = 0.5 # seconds
     
-    full_audio = np.array([])
+    events = [Event(i * note_duration, note_duration, "piano", notes[note])
+              for i, note in enumerate(melody_sequence)]
     
     print("Synthesizing notes...")
-    for note in melody_sequence:
-        note_audio = generate_piano_note(notes[note], note_duration, sample_rate)
-        full_audio = np.concatenate((full_audio, note_audio))
-    
-    # Normalize to 16-bit PCM range
-    full_audio = (full_audio * 32767).astype(np.int16)
+    sequencer = Sequencer({"piano": Instrument(generate_piano_note, vectorized=True)}, sample_rate)
+    full_audio = sequencer.render(events)
     
     timestamp = int(time.time())
-    filename = f"/home/claw/.openclaw/workspace/aria-lullaby-{timestamp}.wav"
+    filename = workspace_path(f"aria-lullaby-{timestamp}.wav")
     
     print(f"Saving to {filename}...")
-    with wave.open(filename, 'w') as f:
-        f.setnchannels(1) # Mono
-        f.setsampwidth(2) # 2 bytes per sample
-        f.setframerate(sample_rate)
-        for sample in full_audio:
-            f.writeframes(struct.pack('h', sample))
-            
+    write_wav(filename, full_audio, sample_rate) # mono 16-bit PCM
     print(f"MEDIA:{filename}")
     return filename
 
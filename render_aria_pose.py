@@ -2,6 +2,8 @@ import math
 import numpy as np
 from PIL import Image, ImageDraw, ImageFilter, ImageEnhance
 
+from rendercore.workspace import workspace_path
+
 def get_rotation_matrix(rx, ry, rz):
     cx, sx = math.cos(rx), math.sin(rx)
     cy, sy = math.cos(ry), math.sin(ry)
@@ -49,7 +51,7 @@ def render_minecraft_aria():
     draw = ImageDraw.Draw(canvas)
     draw.rectangle([0, 750, width, height], fill=(124, 181, 24, 255))
     
-    skin = Image.open("/home/claw/.openclaw/workspace/aria05_skin.png")
+    skin = Image.open(workspace_path("aria05_skin.png"))
     
     # Define parts with Poses
     # Name, Size(w,h,d), Offset(x,y,z), Rotation(rx,ry,rz)
@@ -106,7 +108,7 @@ def render_minecraft_aria():
     enhancer = ImageEnhance.Color(canvas)
     canvas = enhancer.enhance(1.2)
     
-    path = "/home/claw/.openclaw/workspace/aria05_3d_feminine.png"
+    path = workspace_path("aria05_3d_feminine.png")
     canvas.save(path)
     print(f"MEDIA:{path}")
 
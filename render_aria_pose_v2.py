@@ -2,6 +2,8 @@ import math
 import numpy as np
 from PIL import Image, ImageDraw, ImageEnhance
 
+from rendercore.workspace import workspace_path
+
 def get_rotation_matrix(rx, ry, rz):
     cx, sx = math.cos(rx), math.sin(rx)
     cy, sy = math.cos(ry), math.sin(ry)
@@ -29,7 +31,7 @@ def render_minecraft_aria_v2():
     
     # Load skin for colors
     try:
-        skin = Image.open("/home/claw/.openclaw/workspace/aria05_skin.png").convert("RGBA")
+        skin = Image.open(workspace_path("aria05_skin.png")).convert("RGBA")
     except:
         # Fallback if skin not found
         skin = Image.new("RGBA", (64, 64), (255, 0, 0, 255))
@@ -104,7 +106,7 @@ def render_minecraft_aria_v2():
     enhancer = ImageEnhance.Color(canvas)
     canvas = enhancer.enhance(1.3)
     
-    path = "/home/claw/.openclaw/workspace/aria05_3d_feminine_v3.png"
+    path = workspace_path("aria05_3d_feminine_v3.png")
     canvas.save(path)
     print(f"MEDIA:{path}")
 
@@ -1,161 +1,41 @@
-import math
-import numpy as np
-from PIL import Image, ImageDraw, ImageEnhance, ImageFilter
-import time
+from PIL import ImageEnhance
 
-def normalize(v):
-    norm = np.linalg.norm(v)
-    return v / norm if norm > 0 else v
-
-def intersect_aabb(ray_o, ray_d, box_min, box_max):
-    t_near = -float('inf')
-    t_far = float('inf')
-    for i in range(3):
-        if abs(ray_d[i]) < 1e-6:
-            if ray_o[i] < box_min[i] or ray_o[i] > box_max[i]:
-                return None
-        else:
-            t1 = (box_min[i] - ray_o[i]) / ray_d[i]
-            t2 = (box_max[i] - ray_o[i]) / ray_d[i]
-            t_near = max(t_near, min(t1, t2))
-            t_far = min(t_far, max(t1, t2))
-    if t_near > t_far or t_far < 0:
-        return None
-    return t_near
-
-def intersect_plane(ray_o, ray_d, p_o, p_n):
-    denom = np.dot(ray_d, p_n)
-    if abs(denom) > 1e-6:
-        t = np.dot(p_o - ray_o, p_n) / denom
-        if t >= 0: return t
-    return None
-
-def render_aria_textured():
-    width, height = 800, 800
-    try:
-        sky_img = Image.open("/home/claw/.openclaw/workspace/sky_v4.jpg").convert("RGB")
-        sw, sh = sky_img.size
-        sky_pixels = sky_img.load()
-    except:
-        sky_img = None
-
-    try:
-        skin = Image.open("/home/claw/.openclaw/workspace/aria05_skin.png").convert("RGBA")
-        skin_pixels = skin.load()
-    except:
-        skin = Image.new("RGBA", (64, 64), (255, 0, 0, 255))
-        skin_pixels = skin.load()
-
-    # Camera settings
-    cam_pos = np.array([0.0, 3.5, 11.0])
-    light_dir = normalize(np.array([0.6, 1.0, 0.4]))
-    
-    img = Image.new("RGB", (width, height))
-    pixels = img.load()
+from rendercore import (Box, Floor, Light, Material, PinholeCamera, Scene, load_skin, load_sky,
+                        render_arg_parser, render_options, render_script, workspace_path)
 
+def build_scene():
     # Minecraft T-Pose Geometry
-    # tex_map format: {side: (x, y, w, h)}
     # Head: Front(8,8,8,8), Torso: Front(20,20,8,12), etc.
     parts = [
-        {"name": "Torso", "min": [-0.4, 0, -0.2], "max": [0.4, 1.2, 0.2], "uv": (20,20,8,12)},
-        {"name": "Head",  "min": [-0.4, 1.2, -0.4], "max": [0.4, 2.0, 0.4], "uv": (8,8,8,8)},
-        {"name": "L_Arm", "min": [-1.6, 0.8, -0.2], "max": [-0.4, 1.2, 0.2], "uv": (36,52,4,12)},
-        {"name": "R_Arm", "min": [0.4, 0.8, -0.2], "max": [1.6, 1.2, 0.2], "uv": (44,20,4,12)},
-        {"name": "L_Leg", "min": [-0.4, -1.2, -0.2], "max": [0.0, 0.0, 0.2], "uv": (20,52,4,12)},
-        {"name": "R_Leg", "min": [0.0, -1.2, -0.2], "max": [0.4, 0.0, 0.2], "uv": (4,20,4,12)},
+        Box([-0.4, 0, -0.2],   [0.4, 1.2, 0.2],  Material(uv=(20,20,8,12)), "Torso"),
+        Box([-0.4, 1.2, -0.4], [0.4, 2.0, 0.4],  Material(uv=(8,8,8,8)), "Head"),
+        Box([-1.6, 0.8, -0.2], [-0.4, 1.2, 0.2], Material(uv=(36,52,4,12)), "L_Arm"),
+        Box([0.4, 0.8, -0.2],  [1.6, 1.2, 0.2],  Material(uv=(44,20,4,12)), "R_Arm"),
+        Box([-0.4, -1.2, -0.2], [0.0, 0.0, 0.2], Material(uv=(20,52,4,12)), "L_Leg"),
+        Box([0.0, -1.2, -0.2], [0.4, 0.0, 0.2],  Material(uv=(4,20,4,12)), "R_Leg"),
     ]
-    
-    floor_n = np.array([0.0, 1.0, 0.0])
-    floor_o = np.array([0.0, -1.2, 0.0])
-
-    print("Rendering Textured Aria05...")
-    for py in range(height):
-        for px in range(width):
-            u = (px - width/2) / (width/2)
-            v = (height/2 - py) / (height/2)
-            ray_d = normalize(np.array([u, v, -2.2]))
-
-            t_min = float('inf')
-            hit_color = None
-            hit_pos = None
-            hit_n = None
-
-            # Floor
-            tp = intersect_plane(cam_pos, ray_d, floor_o, floor_n)
-            if tp and tp < t_min:
-                t_min = tp
-                hit_pos = cam_pos + ray_d * tp
-                hit_n = floor_n
-                noise = (math.sin(hit_pos[0] * 5) * math.cos(hit_pos[2] * 5))
-                hit_color = np.array([34, 139, 34]) if noise > 0.2 else np.array([50, 205, 50])
-
-            # Character Parts with Pixel Mapping
-            for p in parts:
-                p_min, p_max = np.array(p["min"]), np.array(p["max"])
-                tb = intersect_aabb(cam_pos, ray_d, p_min, p_max)
-                if tb and tb < t_min:
-                    t_min = tb
-                    hit_pos = cam_pos + ray_d * tb
-                    
-                    # Normal and UV calculation
-                    local_n = np.zeros(3)
-                    uv_x, uv_y = 0, 0
-                    u_start, v_start, u_w, v_h = p["uv"]
-                    
-                    # Map hit_pos to pixel in skin
-                    # Simple front-face mapping for this view
-                    if abs(hit_pos[2] - p_max[2]) < 0.001: # Front
-                        local_n = np.array([0,0,1])
-                        uv_x = (hit_pos[0] - p_min[0]) / (p_max[0] - p_min[0])
-                        uv_y = (p_max[1] - hit_pos[1]) / (p_max[1] - p_min[1])
-                    elif abs(hit_pos[1] - p_max[1]) < 0.001: # Top
-                        local_n = np.array([0,1,0])
-                        uv_x = (hit_pos[0] - p_min[0]) / (p_max[0] - p_min[0])
-                        uv_y = (hit_pos[2] - p_min[2]) / (p_max[2] - p_min[2])
-                    else:
-                        local_n = np.array([1,0,0]) # Side fallback
-                        uv_x = (hit_pos[2] - p_min[2]) / (p_max[2] - p_min[2])
-                        uv_y = (p_max[1] - hit_pos[1]) / (p_max[1] - p_min[1])
-
-                    hit_n = normalize(local_n)
-                    
-                    # Sample pixel from skin
-                    px_x = int(u_start + uv_x * (u_w - 0.01))
-                    px_y = int(v_start + uv_y * (v_h - 0.01))
-                    hit_color = np.array(skin_pixels[px_x % 64, px_y % 64][:3])
-
-            if hit_color is not None:
-                shadow_o = hit_pos + hit_n * 0.001
-                in_shadow = False
-                for p in parts:
-                    if intersect_aabb(shadow_o, light_dir, np.array(p["min"]), np.array(p["max"])):
-                        in_shadow = True
-                        break
-                
-                shadow_factor = 0.6 if in_shadow else 1.0
-                dot = max(0.3, np.dot(hit_n, light_dir))
-                
-                final_c = hit_color * (dot + 0.1) * shadow_factor
-                pixels[px, py] = tuple(np.clip(final_c, 0, 255).astype(int))
-            else:
-                if sky_img:
-                    phi = math.atan2(ray_d[0], ray_d[2])
-                    theta = math.acos(ray_d[1])
-                    sx = int((phi + math.pi) / (2 * math.pi) * (sw - 1))
-                    sy = int(theta / math.pi * (sh - 1))
-                    pixels[px, py] = sky_pixels[sx % sw, sy % sh]
-                else:
-                    pixels[px, py] = (135, 206, 235)
 
+    scene = Scene(parts,
+                  floor=Floor(-1.2, grass_scale=5),
+                  light=Light([0.6, 1.0, 0.4], ambient=0.1, min_diffuse=0.3, shadow_factor=0.6,
+                              shadow_bias=0.001),
+                  sky=load_sky(workspace_path("sky_v4.jpg")),
+                  skin=load_skin(workspace_path("aria05_skin.png")),
+                  face_mode="front", face_eps=0.001)
+    camera = PinholeCamera([0.0, 3.5, 11.0], focal=2.2)
+    return scene, camera
+
+def post_process(img):
     # Post processing
     img = ImageEnhance.Color(img).enhance(1.3)
     img = ImageEnhance.Contrast(img).enhance(1.1)
     img = ImageEnhance.Sharpness(img).enhance(1.5)
+    return img
 
-    timestamp = int(time.time())
-    path = f"/home/claw/.openclaw/workspace/aria05_textured_{timestamp}.png"
-    img.save(path)
-    print(f"MEDIA:{path}")
+def render_aria_textured(width=800, height=800, workers=1, **options):
+    print("Rendering Textured Aria05...")
+    return render_script(build_scene, post_process, "aria05_textured", width, height, workers, **options)
 
 if __name__ == "__main__":
-    render_aria_textured()
+    args = render_arg_parser("Textured Aria05 T-pose", 800, 800).parse_args()
+    render_aria_textured(**render_options(args))
@@ -4,6 +4,8 @@ import numpy as np
 import time
 from PIL import Image, ImageDraw, ImageEnhance, ImageFilter
 
+from rendercore.workspace import workspace_path
+
 def render_space_scene():
     width, height = 1000, 1000
     # 1. Background: Deep Space with Stars
@@ -81,7 +83,7 @@ def render_space_scene():
     img = enhancer.enhance(1.4)
     
     timestamp = int(time.time())
-    path = f"/home/claw/.openclaw/workspace/procedural_earth_{timestamp}.png"
+    path = workspace_path(f"procedural_earth_{timestamp}.png")
     img.save(path)
     print(f"MEDIA:{path}")
 
@@ -4,6 +4,8 @@ from PIL import Image, ImageDraw, ImageEnhance, ImageFilter
 import time
 import random
 
+from rendercore.workspace import workspace_path
+
 def normalize(v):
     norm = np.linalg.norm(v)
     return v / norm if norm > 0 else v
@@ -103,7 +105,7 @@ def render_aria_inner_peace():
     img = ImageEnhance.Brightness(img).enhance(1.1)
 
     timestamp = int(time.time())
-    path = f"/home/claw/.openclaw/workspace/aria_feeling_{timestamp}.png"
+    path = workspace_path(f"aria_feeling_{timestamp}.png")
     img.save(path)
     print(f"MEDIA:{path}")
 
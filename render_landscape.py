@@ -4,6 +4,8 @@ import numpy as np
 import time
 from PIL import Image, ImageDraw, ImageFilter, ImageEnhance
 
+from rendercore.workspace import workspace_path
+
 def generate_noise(w, h, scale=10.0, octaves=4):
     """Simple procedural fractal noise generator (simplified Perlin-ish)"""
     noise = np.zeros((h, w))
@@ -142,7 +144,7 @@ def render_mountain_landscape():
     img = enhancer.enhance(1.4)
 
     timestamp = int(time.time())
-    path = f"/home/claw/.openclaw/workspace/procedural_mountain_{timestamp}.png"
+    path = workspace_path(f"procedural_mountain_{timestamp}.png")
     img.save(path)
     print(f"MEDIA:{path}")
 
@@ -2,6 +2,8 @@ import time
 import random
 from PIL import Image, ImageDraw, ImageEnhance, ImageFilter
 
+from rendercore.workspace import workspace_path
+
 def create_minecraft_scene():
     width, height = 1200, 800
     # Background Sky (Sky blue)
@@ -37,7 +39,7 @@ def create_minecraft_scene():
 
     # 4. Load and paste Aria05 Character
     try:
-        char_img = Image.open("/home/claw/.openclaw/workspace/aria05_alex.png").convert("RGBA")
+        char_img = Image.open(workspace_path("aria05_alex.png")).convert("RGBA")
         # Position character on ground
         char_w, char_h = char_img.size
         paste_x = (width - char_w) // 2
@@ -60,7 +62,7 @@ def create_minecraft_scene():
     img = Image.alpha_composite(img, overlay)
 
     timestamp = int(time.time())
-    filename = f"/home/claw/.openclaw/workspace/mc-aria05-{timestamp}.png"
+    filename = workspace_path(f"mc-aria05-{timestamp}.png")
     img.save(filename)
     print(f"MEDIA:{filename}")
     return filename
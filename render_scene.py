@@ -0,0 +1,17 @@
+from rendercore import apply_post, load_scene_file, render_arg_parser, render_options, render_script
+
+def render_scene(path, width=None, height=None, workers=1, cache_dir=None, **options):
+    # Render a JSON / TOML scene file (see scenes/); the compiled scene is cached by file hash
+    scene, camera, settings = load_scene_file(path, cache_dir)
+    width, height = width or settings["width"], height or settings["height"]
+    print(f"Rendering {path} ({width}x{height})...")
+    return render_script(lambda: (scene, camera), lambda img: apply_post(img, settings["post"]), settings["name"],
+                         width, height, workers, **options)
+
+if __name__ == "__main__":
+    parser = render_arg_parser("Render scene description files", None, None)
+    parser.add_argument("scenes", nargs="+", help=".json or .toml scene files, rendered in turn")
+    parser.add_argument("--cache-dir", help="compiled scene cache (default: <workspace>/scene-cache)")
+    args = parser.parse_args()
+    for path in args.scenes:
+        render_scene(path, cache_dir=args.cache_dir, **render_options(args))
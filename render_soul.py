@@ -2,6 +2,8 @@ import math
 import time
 from PIL import Image, ImageEnhance
 
+from rendercore.workspace import workspace_path
+
 def render_aria_soul():
     width, height = 800, 800
     img = Image.new("RGB", (width, height), (10, 10, 25))
@@ -73,7 +75,7 @@ def render_aria_soul():
     img = brighter.enhance(1.2)
 
     timestamp = int(time.time())
-    filename = f"/home/claw/.openclaw/workspace/aria-soul-{timestamp}.png"
+    filename = workspace_path(f"aria-soul-{timestamp}.png")
     img.save(filename)
     print(f"MEDIA:{filename}")
     return filename
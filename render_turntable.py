@@ -0,0 +1,22 @@
+import importlib
+
+from rendercore import render_arg_parser, render_sequence, turntable, workspace_path
+
+def render_turntable(script, frames=36, degrees=360.0, width=400, height=400, workers=1, samples=1):
+    # Orbit the camera of any render_*.py scene and write a numbered PNG sequence
+    mod = importlib.import_module(script)
+    scene, camera = mod.build_scene()
+    cameras = turntable(camera, frames, degrees)
+    print(f"Rendering {frames} frame turntable of {script} ({width}x{height})...")
+    paths = render_sequence(scene, cameras, width, height, workspace_path(f"{script}_turntable"), script,
+                            post=getattr(mod, "post_process", None), workers=workers, verbose=True, samples=samples)
+    print(f"MEDIA:{workspace_path(f'{script}_turntable')}")
+    return paths
+
+if __name__ == "__main__":
+    parser = render_arg_parser("Turntable animation of a render_*.py scene", 400, 400, still=False)
+    parser.add_argument("script", help="scene module, e.g. render_cinematic")
+    parser.add_argument("--frames", type=int, default=36)
+    parser.add_argument("--degrees", type=float, default=360.0)
+    args = parser.parse_args()
+    render_turntable(args.script, args.frames, args.degrees, args.width, args.height, args.workers, args.samples)
@@ -0,0 +1,21 @@
+"""Shared NumPy ray caster behind the render_*.py box scenes.
+
+Scripts describe a Scene (boxes, floor, light, sky, skin) and a Camera and
+call render(); all intersection work happens in batched kernels here.
+"""
+from .antialias import antialias, edge_mask, stratified_jitter
+from .animation import render_frame, render_sequence, turntable
+from .camera import Camera, PinholeCamera, pixel_grid, yaw_matrix
+from .cli import render_arg_parser, render_options, render_script
+from .geometry import BoxHandle, Geometry
+from .kernels import (intersect_aabb, intersect_aabb_batch, intersect_obb_batch, intersect_plane,
+                      intersect_plane_batch, normalize, normalize_rows, rotation_matrix)
+from .progressive import preview_writer, render_progressive
+from .scenefile import apply_post, compile_scene, load_scene_file
+from .scene import LEAVES, TRUNK, Box, Floor, Light, Material, Scene, scatter_trees
+from .skin import FACES, SkinAtlas, load_skin
+from .sky import SkyMap, load_sky
+from .tilecache import render_cached, tile_keys
+from .tiles import RenderPool, render_tiled, split_tiles
+from .tracer import render, render_pixels, trace
+from .workspace import WORKSPACE, save_array, save_media, workspace_path
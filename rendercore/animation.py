@@ -0,0 +1,58 @@
+import os
+import time
+
+from .tiles import _worker, worker_pool
+from .tracer import render
+
+def turntable(camera, frames, degrees=360.0, pivot=None):
+    # One camera per frame, evenly spaced around the orbit (last frame != first)
+    return [camera.orbit(i * degrees / frames, pivot) for i in range(frames)]
+
+def render_frame(scene, camera, width, height, path, offsets=None, post=None, samples=1):
+    if offsets is not None:
+        scene.pose(offsets)
+    img = render(scene, camera, width, height, samples=samples)
+    if post is not None:
+        img = post(img)
+    img.save(path)
+    return path
+
+def _render_frame_job(job):
+    camera, path, offsets = job
+    return render_frame(_worker["scene"], camera, _worker["width"], _worker["height"], path, offsets,
+                        _worker["post"], _worker["samples"])
+
+def render_sequence(scene, cameras, width, height, out_dir, prefix, poses=None, post=None,
+                    workers=1, verbose=False, samples=1):
+    """Render one numbered PNG per camera into out_dir and return their paths.
+
+    The BVH, sky and skin are built once and reused by every frame. poses is
+    an optional per-frame list of {box name: (dx, dy, dz)} offsets; moving
+    boxes refits the BVH rather than rebuilding it. workers > 1 renders whole
+    frames in parallel, one frame per process at a time. samples > 1
+    antialiases the edges of every frame, as render does.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [(camera, os.path.join(out_dir, f"{prefix}_{i:04d}.png"), poses[i] if poses else None)
+            for i, camera in enumerate(cameras)]
+    scene.bvh() # build before pickling so workers don't each rebuild it
+    start = time.time()
+
+    if workers == 1:
+        results = (render_frame(scene, camera, width, height, path, offsets, post, samples)
+                   for camera, path, offsets in jobs)
+        pool = None
+    else:
+        # The scene (with its BVH and textures) is shipped once per process
+        pool = worker_pool(workers, scene=scene, width=width, height=height, post=post, samples=samples)
+        results = pool.map(_render_frame_job, jobs)
+    paths = []
+    try:
+        for path in results:
+            paths.append(path)
+            if verbose:
+                print(f"Frame {len(paths)}/{len(jobs)} -> {path} ({time.time() - start:.1f}s)")
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return paths
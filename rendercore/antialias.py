@@ -0,0 +1,65 @@
+import math
+import time
+import numpy as np
+from PIL import Image
+
+from .tiles import RenderPool
+
+THRESHOLD = 12 # largest channel step to a neighbour that still counts as flat
+BATCH = 1 << 18 # extra rays traced per batch
+
+def stratified_jitter(count, samples, rng):
+    # (count, samples, 2) sample offsets: one jittered point per cell of a
+    # near-square grid over the pixel's footprint [-0.5, 0.5)^2. When samples
+    # does not fill the grid, each pixel leaves out its own random cells, so
+    # the samples stay centred on the pixel on average
+    nx = math.ceil(math.sqrt(samples))
+    ny = math.ceil(samples / nx)
+    if nx * ny == samples:
+        cells = np.broadcast_to(np.arange(samples), (count, samples))
+    else:
+        cells = np.argsort(rng.random((count, nx * ny)), axis=1)[:, :samples]
+    cell = np.stack([cells % nx, cells // nx], axis=-1).astype(float)
+    return (cell + rng.random((count, samples, 2))) / (nx, ny) - 0.5
+
+def edge_mask(frame, threshold):
+    # Pixels differing from a 4-neighbour by more than threshold in some channel
+    frame = frame.astype(np.int16)
+    mask = np.zeros(frame.shape[:2], dtype=bool)
+    dx = (np.abs(frame[:, 1:] - frame[:, :-1]) > threshold).any(axis=2)
+    dy = (np.abs(frame[1:] - frame[:-1]) > threshold).any(axis=2)
+    mask[:, 1:] |= dx
+    mask[:, :-1] |= dx
+    mask[1:] |= dy
+    mask[:-1] |= dy
+    return mask
+
+def antialias(scene, camera, img, samples, workers=1, threshold=THRESHOLD, seed=0, verbose=False):
+    """Supersample a rendered frame with stratified jitter.
+
+    Pixels whose colour steps by more than threshold to a neighbour (every
+    pixel if threshold is None) are replaced by the mean of samples jittered
+    rays; those rays are just extra rows in the pixel batches, so flat sky
+    and grass keep their single sample and cost nothing more. The jitter is
+    seeded, so a frame antialiases the same way every time.
+    """
+    frame = np.array(img)
+    height, width = frame.shape[:2]
+    if threshold is None:
+        ys, xs = np.divmod(np.arange(width * height), width)
+    else:
+        ys, xs = np.nonzero(edge_mask(frame, threshold))
+    rng = np.random.default_rng(seed)
+    per_batch = max(1, BATCH // samples)
+    start = time.time()
+    with RenderPool(scene, camera, width, height, workers) as pool:
+        for s in range(0, len(xs), per_batch):
+            bx, by = xs[s:s+per_batch], ys[s:s+per_batch]
+            offsets = stratified_jitter(len(bx), samples, rng)
+            px = (bx[:, None] + offsets[..., 0]).ravel()
+            py = (by[:, None] + offsets[..., 1]).ravel()
+            colors = pool.trace(px, py).reshape(len(bx), samples, 3)
+            frame[by, bx] = np.round(colors.mean(axis=1)).astype(np.uint8)
+    if verbose:
+        print(f"Antialiased {len(xs)}/{width * height} pixels x{samples} ({time.time() - start:.1f}s)")
+    return Image.fromarray(frame, "RGB")
@@ -0,0 +1,139 @@
+import numpy as np
+
+from .kernels import intersect_aabb_batch, intersect_obb_batch, occludes, occludes_obb, shared_direction, shared_slab
+
+LEAF_SIZE = 4
+
+class BVH:
+    """Bounding volume hierarchy over a scene's boxes.
+
+    Built once per scene (median split on the longest centroid axis) and
+    traversed with whole ray batches: every node is slab-tested against the
+    rays that reached it, so only rays near a subtree ever see its boxes.
+    obb = (oriented, center, half, inv_rot) marks boxes whose min / max only
+    bound a rotated box, with one center / half / inv_rot row per oriented
+    box in id order; leaves test those with the oriented-box kernel.
+    """
+
+    def __init__(self, box_min, box_max, leaf_size=LEAF_SIZE, obb=None):
+        self.box_min = box_min
+        self.box_max = box_max
+        self.obb = obb
+        self._rotated = None if obb is None else np.flatnonzero(obb[0])
+        self.leaf_size = leaf_size
+        self._centers = (box_min + box_max) / 2
+        self.node_min, self.node_max, self.children, self.axis, self.leaves = [], [], [], [], []
+        if len(box_min):
+            self._build(np.arange(len(box_min)))
+        self.node_min = np.array(self.node_min).reshape(-1, 3)
+        self.node_max = np.array(self.node_max).reshape(-1, 3)
+        del self._centers
+
+    def _build(self, ids):
+        node = len(self.node_min)
+        self.node_min.append(self.box_min[ids].min(axis=0))
+        self.node_max.append(self.box_max[ids].max(axis=0))
+        self.children.append(None)
+        self.axis.append(0)
+        self.leaves.append(None)
+        if len(ids) <= self.leaf_size:
+            self.leaves[node] = np.sort(ids)
+            return node
+        c = self._centers[ids]
+        axis = int(np.argmax(c.max(axis=0) - c.min(axis=0)))
+        ids = ids[np.argsort(c[:, axis], kind="stable")]
+        mid = len(ids) // 2
+        left = self._build(ids[:mid])
+        right = self._build(ids[mid:])
+        self.children[node] = (left, right)
+        self.axis[node] = axis
+        return node
+
+    def refit(self, box_min, box_max, obb=None):
+        # Moved boxes keep the tree topology; only node bounds are recomputed,
+        # children before parents (nodes are stored in pre-order)
+        self.box_min, self.box_max, self.obb = box_min, box_max, obb
+        self._rotated = None if obb is None else np.flatnonzero(obb[0])
+        for node in range(len(self.node_min) - 1, -1, -1):
+            if self.leaves[node] is not None:
+                ids = self.leaves[node]
+                self.node_min[node] = box_min[ids].min(axis=0)
+                self.node_max[node] = box_max[ids].max(axis=0)
+            else:
+                left, right = self.children[node]
+                self.node_min[node] = np.minimum(self.node_min[left], self.node_min[right])
+                self.node_max[node] = np.maximum(self.node_max[left], self.node_max[right])
+
+    def _obb(self, gi):
+        # center, half, inv_rot of oriented box gi
+        _, center, half, inv_rot = self.obb
+        k = np.searchsorted(self._rotated, gi)
+        return center[k], half[k], inv_rot[k]
+
+    def _intersect(self, o, d, gi):
+        if self.obb is not None and self.obb[0][gi]:
+            return intersect_obb_batch(o, d, *self._obb(gi))[0]
+        return intersect_aabb_batch(o, d, self.box_min[gi], self.box_max[gi])
+
+    def _push_children(self, stack, node, rays, ray_d):
+        # Visit the near child first so t_min shrinks early and prunes the far one
+        left, right = self.children[node]
+        if ray_d[rays, self.axis[node]].mean() < 0:
+            left, right = right, left
+        stack.append((right, rays))
+        stack.append((left, rays))
+
+    def closest_hit(self, origin, ray_d, t_min, hit_id):
+        # Updates t_min / hit_id in place; equal distances keep the lower box
+        # index, same as testing the boxes in list order
+        if not len(self.node_min): return
+        origin = np.broadcast_to(origin, ray_d.shape)
+        stack = [(0, np.arange(len(ray_d)))]
+        while stack:
+            node, rays = stack.pop()
+            tn = intersect_aabb_batch(origin[rays], ray_d[rays], self.node_min[node], self.node_max[node])
+            rays = rays[tn <= t_min[rays]]
+            if not len(rays): continue
+            if self.leaves[node] is None:
+                self._push_children(stack, node, rays, ray_d)
+                continue
+            o, d = origin[rays], ray_d[rays]
+            for gi in self.leaves[node]:
+                tb = self._intersect(o, d, gi)
+                cur_t, cur_id = t_min[rays], hit_id[rays]
+                m = (tb != 0) & ((tb < cur_t) | ((tb == cur_t) & (gi < cur_id)))
+                t_min[rays[m]] = tb[m]
+                hit_id[rays[m]] = gi
+
+    def any_hit(self, origins, direction):
+        # True where any box blocks rays from origins along one shared
+        # direction; rays drop out as soon as an occluder is found
+        blocked = np.zeros(len(origins), dtype=bool)
+        if not len(self.node_min): return blocked
+        inv_d, flat = shared_direction(direction)
+        stack = [(0, np.arange(len(origins)))]
+        while stack:
+            node, rays = stack.pop()
+            rays = rays[~blocked[rays]]
+            if not len(rays): continue
+            _, enter = shared_slab(origins[rays], inv_d, flat, self.node_min[node:node+1],
+                                   self.node_max[node:node+1])
+            rays = rays[enter[:, 0]]
+            if not len(rays): continue
+            if self.leaves[node] is None:
+                left, right = self.children[node]
+                if direction[self.axis[node]] < 0: left, right = right, left
+                stack.append((right, rays))
+                stack.append((left, rays))
+                continue
+            ids = self.leaves[node]
+            if self.obb is not None:
+                oriented = self.obb[0]
+                for gi in ids[oriented[ids]]:
+                    blocked[rays[occludes_obb(origins[rays], direction, *self._obb(gi))]] = True
+                ids = ids[~oriented[ids]]
+                rays = rays[~blocked[rays]]
+                if not len(rays) or not len(ids): continue
+            hits = occludes(origins[rays], inv_d, flat, self.box_min[ids], self.box_max[ids])
+            blocked[rays[hits.any(axis=1)]] = True
+        return blocked
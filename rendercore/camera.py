@@ -0,0 +1,89 @@
+import math
+import numpy as np
+
+from .kernels import normalize, normalize_rows
+
+def pixel_grid(width, height):
+    # Flat pixel coordinates for the whole frame, row-major like the old loops
+    py, px = np.mgrid[0:height, 0:width]
+    return px.ravel().astype(float), py.ravel().astype(float)
+
+def yaw_matrix(degrees):
+    # Rotation about +Y; positive angles turn counter-clockwise seen from above
+    a = math.radians(degrees)
+    c, s = math.cos(a), math.sin(a)
+    return np.array([[c, 0.0, s], [0.0, 1.0, 0.0], [-s, 0.0, c]])
+
+def _orbit_point(point, degrees, pivot):
+    return pivot + yaw_matrix(degrees) @ (point - pivot)
+
+class Camera:
+    """Look-at camera with a vertical FOV and an optional dutch tilt (degrees).
+
+    The tilt leans the up vector toward +X; world_up, when given, replaces
+    that vector outright (orbit passes it turned along with the camera).
+    """
+
+    def __init__(self, pos, look_at, fov=20, tilt=0.0, world_up=None):
+        self.pos = np.array(pos, dtype=float)
+        self.look_at = np.array(look_at, dtype=float)
+        self.fov = fov
+        self.tilt = tilt
+        if world_up is None:
+            tilt_angle = math.radians(tilt)
+            world_up = [math.sin(tilt_angle), math.cos(tilt_angle), 0.0]
+        self.world_up = np.array(world_up, dtype=float)
+        self.forward = normalize(self.look_at - self.pos)
+        self.right = normalize(np.cross(self.forward, self.world_up))
+        self.up = np.cross(self.right, self.forward)
+        self.zoom = 1.0 / math.tan(math.radians(fov / 2))
+
+    def rays(self, px, py, width, height):
+        aspect = width / height
+        u = ((2.0 * px / width - 1.0) * aspect / self.zoom)[:, None]
+        v = ((1.0 - 2.0 * py / height) / self.zoom)[:, None]
+        return normalize_rows(u * self.right + v * self.up + self.forward)
+
+    def project(self, points, width, height):
+        # Inverse of rays(): pixel (px, py) of each (N, 3) point, plus its depth
+        # along the view axis (only points with depth > 0 are in front)
+        rel = points - self.pos
+        depth = rel @ self.forward
+        with np.errstate(divide="ignore", invalid="ignore"):
+            u, v = rel @ self.right / depth, rel @ self.up / depth
+        aspect = width / height
+        return (u * self.zoom / aspect + 1.0) * width / 2, (1.0 - v * self.zoom) * height / 2, depth
+
+    def orbit(self, degrees, pivot=None):
+        # Same camera swung around a vertical axis through pivot (default: look_at);
+        # the up vector turns too, so the dutch tilt keeps its roll in frame
+        pivot = self.look_at if pivot is None else np.array(pivot, dtype=float)
+        return Camera(_orbit_point(self.pos, degrees, pivot), _orbit_point(self.look_at, degrees, pivot),
+                      self.fov, self.tilt, yaw_matrix(degrees) @ self.world_up)
+
+class PinholeCamera:
+    """Camera looking down -Z (turned by yaw degrees), as used by the square 800x800 scenes."""
+
+    def __init__(self, pos, focal=2.0, yaw=0.0):
+        self.pos = np.array(pos, dtype=float)
+        self.focal = focal
+        self.yaw = yaw
+
+    def rays(self, px, py, width, height):
+        u = (px - width/2) / (width/2)
+        v = (height/2 - py) / (height/2)
+        d = normalize_rows(np.stack([u, v, np.full_like(u, -self.focal)], axis=1))
+        return d @ yaw_matrix(self.yaw).T if self.yaw else d
+
+    def project(self, points, width, height):
+        local = (points - self.pos) @ yaw_matrix(self.yaw)
+        depth = -local[:, 2]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            u, v = local[:, 0] * self.focal / depth, local[:, 1] * self.focal / depth
+        return u * width / 2 + width / 2, height / 2 - v * height / 2, depth
+
+    def orbit(self, degrees, pivot=None):
+        # Swing around a vertical axis through pivot (default: the origin),
+        # turning with it so the subject stays in view
+        pivot = np.zeros(3) if pivot is None else np.array(pivot, dtype=float)
+        return PinholeCamera(_orbit_point(self.pos, degrees, pivot), self.focal, self.yaw + degrees)
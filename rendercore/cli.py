@@ -0,0 +1,49 @@
+import argparse
+import os
+
+from .progressive import preview_writer
+from .tracer import render
+from .workspace import save_media, workspace_path
+
+def render_arg_parser(description, width, height, still=True):
+    # Shared command line for the render_*.py scene scripts; still=False
+    # leaves out the single-frame options (previews, tile cache) for sequences
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--width", type=int, default=width)
+    parser.add_argument("--height", type=int, default=height)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="render processes (default: all cores, 1 renders in-process)")
+    parser.add_argument("--samples", type=int, default=1,
+                        help="antialiasing rays per edge pixel (default: 1, no antialiasing)")
+    if not still:
+        return parser
+    # A cached render has no coarse-to-fine passes to preview
+    passes = parser.add_mutually_exclusive_group()
+    passes.add_argument("--preview", type=float, metavar="SECONDS",
+                        help="render coarse-to-fine, saving a preview PNG at most every SECONDS")
+    passes.add_argument("--tile-cache", metavar="DIR",
+                        help="reuse tiles unchanged since an earlier render, cached in DIR (no previews)")
+    parser.add_argument("--preview-tolerance", type=int, metavar="LEVELS",
+                        help="needs --preview: fill cells whose corners differ by at most LEVELS (0-255) "
+                             "instead of tracing them; faster but approximate")
+    return parser
+
+def render_options(args):
+    # render_script keyword arguments from a render_arg_parser namespace
+    return {"width": args.width, "height": args.height, "workers": args.workers, "preview": args.preview,
+            "samples": args.samples, "tile_cache": args.tile_cache, "tolerance": args.preview_tolerance}
+
+def render_script(build_scene, post_process, name, width, height, workers=1, preview=None, **options):
+    """Render build_scene()'s scene and camera, post-process the frame and save it as name.
+
+    What the render_*.py scene scripts share: preview (seconds) saves
+    coarse-to-fine previews to <name>_preview.png, and every other option
+    (samples, tile_cache, verbose, ...) goes to render() as is, so a new
+    flag only needs adding to render_arg_parser and render_options.
+    """
+    scene, camera = build_scene()
+    on_pass = preview_writer(workspace_path(f"{name}_preview.png"), preview) if preview is not None else None
+    img = render(scene, camera, width, height, workers=workers, on_pass=on_pass, **options)
+    if post_process is not None:
+        img = post_process(img)
+    return save_media(img, name)
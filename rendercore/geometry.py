@@ -0,0 +1,110 @@
+import numpy as np
+
+from .kernels import rotation_matrix
+from .skin import face_rects
+
+class BoxHandle:
+    """One box of a Geometry: a view by index, no arrays of its own."""
+
+    __slots__ = ("geometry", "index")
+
+    def __init__(self, geometry, index):
+        self.geometry = geometry
+        self.index = index
+
+    @property
+    def min(self):
+        return self.geometry.min[self.index]
+
+    @property
+    def max(self):
+        return self.geometry.max[self.index]
+
+    @property
+    def name(self):
+        return self.geometry.names[self.index]
+
+    @property
+    def material(self):
+        return int(self.geometry.material[self.index])
+
+    @property
+    def color(self):
+        return self.geometry.colors[self.geometry.material[self.index]]
+
+    @property
+    def oriented(self):
+        return bool(self.geometry.oriented[self.index])
+
+    def __repr__(self):
+        return f"BoxHandle({self.index}, {self.name!r}, min={self.min.tolist()}, max={self.max.tolist()})"
+
+class Geometry:
+    """Scene boxes as a structure of arrays, the layout the kernels stream over.
+
+    Per box: world-space AABB min / max (float32 (N, 3); a rotated box is
+    bounded by its rotated extents), an oriented flag and a material id.
+    Only the oriented boxes, listed in rotated, also get a center / half
+    extents / inverse rotation row for the oriented-box kernel (row k is
+    box rotated[k], see obb_rows). Materials are deduplicated into a small
+    table: uint8 colors, float32 skin rects (M, 6, 4), textured flags, the
+    specular terms and lit flags. geometry[i] is a BoxHandle; no per-box Python
+    objects are kept.
+    """
+
+    def __init__(self, boxes):
+        boxes = list(boxes)
+        n = len(boxes)
+        materials = {}
+        mat_ids = []
+        for b in boxes:
+            m = b.material
+            key = (m.color, repr(m.uv), m.specular, m.shininess, m.lit)
+            mat_ids.append(materials.setdefault(key, (len(materials), m))[0])
+        table = [m for _, m in materials.values()]
+        self.colors = np.array([m.color for m in table], dtype=np.uint8).reshape(-1, 3)
+        self.uv = np.array([face_rects(m.uv) for m in table], dtype=np.float32).reshape(-1, 6, 4)
+        self.textured = np.array([m.uv is not None for m in table], dtype=bool)
+        self.specular = np.array([m.specular for m in table], dtype=float)
+        self.shininess = np.array([m.shininess for m in table], dtype=float)
+        self.lit = np.array([m.lit for m in table], dtype=bool)
+        self.material = np.array(mat_ids, dtype=np.uint16 if len(table) < 1 << 16 else np.uint32)
+
+        self.names = [b.name for b in boxes]
+        self.oriented = np.array([b.rot is not None for b in boxes], dtype=bool)
+        self.rotated = np.flatnonzero(self.oriented)
+        rotated = [boxes[i] for i in self.rotated]
+        self.center = np.array([(b.min + b.max) / 2 for b in rotated], dtype=np.float32).reshape(-1, 3)
+        self.half = np.array([(b.max - b.min) / 2 for b in rotated], dtype=np.float32).reshape(-1, 3)
+        self.inv_rot = np.array([rotation_matrix(*b.rot).T for b in rotated], dtype=np.float32).reshape(-1, 3, 3)
+        self.min, self.max = np.empty((n, 3), dtype=np.float32), np.empty((n, 3), dtype=np.float32)
+        for i, b in enumerate(boxes):
+            self.min[i], self.max[i] = b.bounds()
+        self._authored = None # (min, max, center) as built, kept from the first shift() on
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        if not -len(self) <= index < len(self):
+            raise IndexError(index)
+        return BoxHandle(self, index % len(self))
+
+    def __iter__(self):
+        return (BoxHandle(self, i) for i in range(len(self)))
+
+    def shift(self, offsets):
+        # Place every box at its authored position plus offsets ((N, 3))
+        if self._authored is None:
+            self._authored = (self.min, self.max, self.center)
+        box_min, box_max, center = self._authored
+        self.min, self.max = ((a + offsets).astype(np.float32) for a in (box_min, box_max))
+        self.center = (center + offsets[self.rotated]).astype(np.float32)
+
+    def obb_rows(self, ids):
+        # Rows of center / half / inv_rot for the oriented box ids
+        return np.searchsorted(self.rotated, ids)
+
+    def obb(self):
+        # (oriented, center, half, inv_rot) for the BVH, or None without rotated boxes
+        return (self.oriented, self.center, self.half, self.inv_rot) if len(self.rotated) else None
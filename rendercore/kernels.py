@@ -0,0 +1,142 @@
+import math
+import numpy as np
+
+def normalize(v):
+    norm = np.linalg.norm(v)
+    return v / norm if norm > 0 else v
+
+def normalize_rows(v):
+    # Batched normalize: zero-length rows are left untouched
+    norm = np.sqrt(np.einsum("ij,ij->i", v, v))[:, None]
+    return np.divide(v, norm, out=v.copy(), where=norm > 0)
+
+def rotation_matrix(rx, ry, rz):
+    # Euler angles in radians, applied x, then y, then z (Rz @ Ry @ Rx)
+    cx, sx = math.cos(rx), math.sin(rx)
+    cy, sy = math.cos(ry), math.sin(ry)
+    cz, sz = math.cos(rz), math.sin(rz)
+    Rx = np.array([[1, 0, 0], [0, cx, -sx], [0, sx, cx]])
+    Ry = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]])
+    Rz = np.array([[cz, -sz, 0], [sz, cz, 0], [0, 0, 1]])
+    return Rz @ Ry @ Rx
+
+def intersect_aabb_batch(ray_o, ray_d, box_min, box_max):
+    # Slab test for a batch of rays against one box. Same rules as the old
+    # scalar intersect_aabb: t_near per ray, NaN where the box is missed.
+    n = len(ray_d)
+    ray_o = np.broadcast_to(ray_o, ray_d.shape)
+    t_near = np.full(n, -np.inf)
+    t_far = np.full(n, np.inf)
+    miss = np.zeros(n, dtype=bool)
+    for i in range(3):
+        d, o = ray_d[:, i], ray_o[:, i]
+        flat = np.abs(d) < 1e-6
+        miss |= flat & ((o < box_min[i]) | (o > box_max[i]))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t1 = (box_min[i] - o) / d
+            t2 = (box_max[i] - o) / d
+        t_near = np.where(flat, t_near, np.maximum(t_near, np.minimum(t1, t2)))
+        t_far = np.where(flat, t_far, np.minimum(t_far, np.maximum(t1, t2)))
+    miss |= (t_near > t_far) | (t_far < 0)
+    return np.where(miss, np.nan, t_near)
+
+def intersect_obb_batch(ray_o, ray_d, center, half, inv_rot):
+    """Slab test of a batch of rays against oriented boxes, in each box's own frame.
+
+    center / half / inv_rot describe one box, or one box per ray ((N, 3),
+    (N, 3), (N, 3, 3)); inv_rot takes world vectors into the box frame.
+    Returns (t, normal, uv, face): t follows intersect_aabb_batch (NaN on a
+    miss), normal is the world normal of the face the ray enters, uv (N, 2)
+    the position across that face and face its index into skin.FACES.
+    """
+    n = len(ray_d)
+    inv_rot = np.broadcast_to(inv_rot, (n, 3, 3))
+    o = np.einsum("nij,nj->ni", inv_rot, np.broadcast_to(ray_o - center, ray_d.shape))
+    d = np.einsum("nij,nj->ni", inv_rot, ray_d)
+    half = np.broadcast_to(half, d.shape)
+    t_near = np.full(n, -np.inf)
+    t_far = np.full(n, np.inf)
+    axis = np.zeros(n, dtype=np.intp)
+    miss = np.zeros(n, dtype=bool)
+    for i in range(3):
+        flat = np.abs(d[:, i]) < 1e-6
+        miss |= flat & (np.abs(o[:, i]) > half[:, i])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t1 = (-half[:, i] - o[:, i]) / d[:, i]
+            t2 = (half[:, i] - o[:, i]) / d[:, i]
+        near = np.where(flat, -np.inf, np.minimum(t1, t2))
+        axis = np.where(near > t_near, i, axis)
+        t_near = np.maximum(t_near, near)
+        t_far = np.where(flat, t_far, np.minimum(t_far, np.maximum(t1, t2)))
+    miss |= (t_near > t_far) | (t_far < 0)
+    t = np.where(miss, np.nan, t_near)
+
+    rows = np.arange(n)
+    local_n = np.zeros((n, 3))
+    local_n[rows, axis] = np.where(d[rows, axis] < 0, 1.0, -1.0)
+    normal = np.einsum("nji,nj->ni", inv_rot, local_n)
+    p = o + d * np.nan_to_num(t)[:, None]
+    size = 2 * half
+    uv = np.empty((n, 2))
+    uv[:, 0] = np.where(axis == 2, (p[:, 0] + half[:, 0]) / size[:, 0], (p[:, 2] + half[:, 2]) / size[:, 2])
+    uv[:, 1] = (half[:, 1] - p[:, 1]) / size[:, 1]
+    face = axis * 2 + (local_n[rows, axis] < 0)
+    return t, normal, uv, face
+
+def occludes_obb(origins, direction, center, half, inv_rot):
+    # Any-hit mask (N,) of rays sharing one direction against one oriented box
+    ray_d = np.broadcast_to(np.asarray(direction, dtype=float), origins.shape)
+    t = intersect_obb_batch(origins, ray_d, center, half, inv_rot)[0]
+    return ~np.isnan(t) & (t != 0)
+
+def intersect_plane_batch(ray_o, ray_d, p_o, p_n):
+    denom = ray_d @ p_n
+    ok = np.abs(denom) > 1e-6
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.dot(p_o - ray_o, p_n) / denom
+    return np.where(ok & (t >= 0), t, np.nan)
+
+def shared_direction(direction):
+    # Precomputed inverse for a batch of rays that all share one direction,
+    # e.g. shadow rays toward a directional light
+    d = np.asarray(direction, dtype=float)
+    flat = np.abs(d) < 1e-6
+    with np.errstate(divide="ignore"):
+        inv_d = np.where(flat, 0.0, 1.0 / d)
+    return inv_d, flat
+
+def shared_slab(origins, inv_d, flat, box_min, box_max):
+    # Slab test of rays sharing one direction against (B, 3) boxes at once.
+    # Returns (t_near, hit), both (N, B).
+    t_near = np.full((len(origins), len(box_min)), -np.inf)
+    t_far = np.full_like(t_near, np.inf)
+    miss = np.zeros(t_near.shape, dtype=bool)
+    for i in range(3):
+        o = origins[:, i, None]
+        if flat[i]:
+            miss |= (o < box_min[:, i]) | (o > box_max[:, i])
+            continue
+        t1 = (box_min[:, i] - o) * inv_d[i]
+        t2 = (box_max[:, i] - o) * inv_d[i]
+        if inv_d[i] < 0: t1, t2 = t2, t1
+        np.maximum(t_near, t1, out=t_near)
+        np.minimum(t_far, t2, out=t_far)
+    return t_near, ~miss & (t_near <= t_far) & (t_far >= 0)
+
+def occludes(origins, inv_d, flat, box_min, box_max):
+    # Any-hit mask (N, B): True where the old intersect_aabb was truthy
+    t_near, hit = shared_slab(origins, inv_d, flat, box_min, box_max)
+    return hit & (t_near != 0)
+
+def hit_mask(t, t_min):
+    # Mirrors the old "if tb and tb < t_min" check (NaN compares False, 0 is falsy)
+    return (t != 0) & (t < t_min)
+
+def intersect_aabb(ray_o, ray_d, box_min, box_max):
+    # Single-ray convenience wrapper, returns None on a miss
+    t = intersect_aabb_batch(np.asarray(ray_o, dtype=float), np.asarray(ray_d, dtype=float)[None], box_min, box_max)[0]
+    return None if np.isnan(t) else float(t)
+
+def intersect_plane(ray_o, ray_d, p_o, p_n):
+    t = intersect_plane_batch(np.asarray(ray_o, dtype=float), np.asarray(ray_d, dtype=float)[None], p_o, p_n)[0]
+    return None if np.isnan(t) else float(t)
@@ -0,0 +1,60 @@
+import time
+import numpy as np
+from PIL import Image
+
+from .tiles import RenderPool
+
+START_STEP = 8 # first pass traces every 8th pixel in x and y (1/64 of the rays)
+
+def preview_writer(path, interval=1.0):
+    # on_pass callback that saves the preview at most once per interval seconds
+    last = [None]
+    def write(img, step):
+        now = time.time()
+        if last[0] is None or now - last[0] >= interval:
+            img.save(path)
+            last[0] = now
+            print(f"Preview 1/{step} -> {path}")
+    return write
+
+def render_progressive(scene, camera, width, height, workers=1, on_pass=None, start_step=START_STEP,
+                       tolerance=None, verbose=False):
+    """Render coarse-to-fine: every pass halves the pixel step.
+
+    Each pass only traces lattice pixels the previous passes did not, and
+    on_pass(img, step) gets a nearest-filled preview after every pass. The
+    last pass (step 1) is the full-resolution frame, identical to render().
+    With a tolerance, cells whose four coarser corners differ by at most
+    that much are filled instead of traced, so flat sky and grass are
+    skipped at the cost of an approximate result.
+    """
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    known = np.zeros((height, width), dtype=bool)
+    start = time.time()
+    step = start_step
+    with RenderPool(scene, camera, width, height, workers) as pool:
+        while step >= 1:
+            ys, xs = np.mgrid[0:height:step, 0:width:step]
+            ys, xs = ys.ravel(), xs.ravel()
+            todo = ~known[ys, xs]
+            if tolerance is not None and step < start_step:
+                parent = step * 2
+                y0, x0 = ys // parent * parent, xs // parent * parent
+                y1 = np.minimum(y0 + parent, (height - 1) // parent * parent)
+                x1 = np.minimum(x0 + parent, (width - 1) // parent * parent)
+                corners = np.stack([frame[y0, x0], frame[y0, x1], frame[y1, x0], frame[y1, x1]]).astype(int)
+                flat = todo & ((corners.max(axis=0) - corners.min(axis=0)).max(axis=1) <= tolerance)
+                frame[ys[flat], xs[flat]] = frame[y0[flat], x0[flat]]
+                known[ys[flat], xs[flat]] = True
+                todo &= ~flat
+            ys, xs = ys[todo], xs[todo]
+            frame[ys, xs] = pool.trace(xs.astype(float), ys.astype(float))
+            known[ys, xs] = True
+            if verbose:
+                print(f"Pass 1/{step}: traced {len(ys)} rays ({time.time() - start:.1f}s)")
+            if on_pass is not None:
+                rows = np.arange(height) // step * step
+                cols = np.arange(width) // step * step
+                on_pass(Image.fromarray(frame[rows[:, None], cols], "RGB"), step)
+            step //= 2
+    return Image.fromarray(frame, "RGB")
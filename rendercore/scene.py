@@ -0,0 +1,128 @@
+import random
+import numpy as np
+
+from .bvh import BVH
+from .geometry import Geometry
+from .kernels import normalize, rotation_matrix
+
+GRASS_DARK = (34, 139, 34)
+GRASS_LIGHT = (50, 205, 50)
+
+class Material:
+    def __init__(self, color=(200, 200, 200), uv=None, specular=0.0, shininess=32, lit=True):
+        self.color = tuple(color)
+        self.uv = uv # (u, v, w, h) skin rect, or a dict of rects per face name; None for flat color
+        self.specular = specular
+        self.shininess = shininess
+        self.lit = lit # False: the color is drawn as is, without light or shadow
+
+TRUNK = Material((101, 67, 33))
+LEAVES = Material((34, 139, 34))
+
+class Box:
+    """Axis-aligned box; rot = (rx, ry, rz) radians turns it about its center (rotation_matrix order)."""
+
+    def __init__(self, min, max, material=None, name=None, rot=None):
+        self.min = np.array(min, dtype=float)
+        self.max = np.array(max, dtype=float)
+        self.material = material or Material()
+        self.name = name
+        self.rot = None if rot is None or not any(rot) else tuple(rot)
+
+    @classmethod
+    def from_center(cls, pos, size, material=None, name=None, rot=None):
+        half = [s/2 for s in size]
+        return cls(np.array(pos) - half, np.array(pos) + half, material, name, rot)
+
+    def bounds(self):
+        # World-space AABB: a rotated box is bounded by its rotated half extents
+        if self.rot is None:
+            return self.min, self.max
+        center = (self.min + self.max) / 2
+        extent = np.abs(rotation_matrix(*self.rot)) @ ((self.max - self.min) / 2)
+        return center - extent, center + extent
+
+class Floor:
+    """Infinite y-up plane: flat colored, procedural grass, or a checkerboard
+    of two colors on unit squares. lit=False draws it without light or shadow.
+    """
+
+    def __init__(self, y=0.0, color=None, grass_scale=None, checker=None, lit=True):
+        self.y = y
+        self.color = color
+        self.grass_scale = grass_scale
+        self.checker = checker
+        self.lit = lit
+
+    def colors(self, hit_pos):
+        if self.checker is not None:
+            # Parity of the truncated x + z, like the old per-pixel house loop
+            odd = (hit_pos[:, 0].astype(int) + hit_pos[:, 2].astype(int)) % 2 == 1
+            return np.where(odd[:, None], self.checker[1], self.checker[0]).astype(float)
+        if self.grass_scale is None:
+            return np.broadcast_to(np.array(self.color, dtype=float), hit_pos.shape)
+        noise = np.sin(hit_pos[:, 0] * self.grass_scale) * np.cos(hit_pos[:, 2] * self.grass_scale)
+        return np.where((noise > 0.2)[:, None], GRASS_DARK, GRASS_LIGHT).astype(float)
+
+class Light:
+    """Directional light plus the shading constants the scenes tweak."""
+
+    def __init__(self, direction, ambient=0.1, min_diffuse=0.2, shadow_factor=0.5,
+                 shadow_bias=0.002, shadows=True):
+        self.direction = normalize(np.array(direction, dtype=float))
+        self.ambient = ambient
+        self.min_diffuse = min_diffuse
+        self.shadow_factor = shadow_factor
+        self.shadow_bias = shadow_bias
+        self.shadows = shadows
+
+class Scene:
+    """Boxes over an optional floor, lit by one light, with a SkyMap behind.
+
+    face_mode picks how box hits get normals and skin UVs: "axis" snaps each
+    axis within face_eps of a face, "front" classifies front/top/side only.
+    """
+
+    def __init__(self, boxes, floor=None, light=None, sky=None, sky_color=(135, 206, 235),
+                 skin=None, face_mode="axis", face_eps=0.005):
+        self.geometry = boxes if isinstance(boxes, Geometry) else Geometry(boxes)
+        self.floor = floor
+        self.light = light or Light([0.6, 1.0, 0.4])
+        self.sky = sky
+        self.sky_color = sky_color
+        self.skin = skin
+        self.face_mode = face_mode
+        self.face_eps = face_eps
+        self._bvh = None
+
+    def bvh(self):
+        if self._bvh is None:
+            geo = self.geometry
+            self._bvh = BVH(geo.min, geo.max, obb=geo.obb())
+        return self._bvh
+
+    def pose(self, offsets):
+        # Shift named boxes by (dx, dy, dz) from where they were authored; every
+        # other box goes back to its authored place. Refits an existing BVH
+        # instead of rebuilding it.
+        geo = self.geometry
+        shift = np.zeros((len(geo), 3))
+        for i, name in enumerate(geo.names):
+            if name in offsets: shift[i] = offsets[name]
+        geo.shift(shift)
+        if self._bvh is not None:
+            self._bvh.refit(geo.min, geo.max, geo.obb())
+
+def scatter_trees(count, x_range, z_range, clearance, ground, trunk_top, leaf_top, leaf_half,
+                  seed=42):
+    # Trunk + leaf block trees kept out of the clearance square at the origin
+    rng = random.Random(seed)
+    trees = []
+    for _ in range(count):
+        while True:
+            tx, tz = rng.uniform(*x_range), rng.uniform(*z_range)
+            if abs(tx) > clearance or abs(tz) > clearance: break
+        trees.append(Box([tx-0.2, ground, tz-0.2], [tx+0.2, trunk_top, tz+0.2], TRUNK, "trunk"))
+        trees.append(Box([tx-leaf_half, trunk_top, tz-leaf_half], [tx+leaf_half, leaf_top, tz+leaf_half],
+                         LEAVES, "leaves"))
+    return trees
@@ -0,0 +1,113 @@
+import hashlib
+import json
+import os
+import pickle
+from PIL import ImageEnhance, ImageFilter
+
+from .camera import Camera, PinholeCamera
+from .scene import Box, Floor, Light, Material, Scene, scatter_trees
+from .skin import load_skin
+from .sky import load_sky
+from .workspace import workspace_path
+
+COMPILER_VERSION = 6 # bump when compile_scene changes what a file compiles to
+
+ENHANCE = {"color": ImageEnhance.Color, "contrast": ImageEnhance.Contrast,
+           "brightness": ImageEnhance.Brightness, "sharpness": ImageEnhance.Sharpness}
+FILTERS = {"sharpen": ImageFilter.SHARPEN, "smooth": ImageFilter.SMOOTH, "detail": ImageFilter.DETAIL}
+
+def read_scene_file(path):
+    # Scene description as a dict, from .json or .toml
+    with open(path, "rb") as f:
+        data = f.read()
+    if path.endswith(".toml"):
+        import tomllib
+        return tomllib.loads(data.decode())
+    return json.loads(data)
+
+def _material(spec):
+    uv = spec.get("uv")
+    if isinstance(uv, list):
+        uv = tuple(uv)
+    return Material(spec.get("color", (200, 200, 200)), uv, spec.get("specular", 0.0), spec.get("shininess", 32),
+                    spec.get("lit", True))
+
+def _box(spec):
+    if "pos" in spec:
+        return Box.from_center(spec["pos"], spec["size"], _material(spec), spec.get("name"), spec.get("rot"))
+    return Box(spec["min"], spec["max"], _material(spec), spec.get("name"), spec.get("rot"))
+
+def _camera(spec):
+    if "look_at" in spec:
+        return Camera(spec["pos"], spec["look_at"], spec.get("fov", 20), spec.get("tilt", 0.0))
+    return PinholeCamera(spec["pos"], spec.get("focal", 2.0), spec.get("yaw", 0.0))
+
+def compile_scene(desc):
+    """Build the Scene and camera a scene description asks for.
+
+    The scene's packed Geometry and BVH are built here, so a pickled
+    compiled scene is ready to trace. Sky and skin stay unloaded (paths
+    only); load_compiled attaches them.
+    """
+    boxes = [_box(spec) for spec in desc.get("boxes", [])]
+    trees = desc.get("trees")
+    if trees:
+        boxes += scatter_trees(trees["count"], trees["x_range"], trees["z_range"], trees["clearance"],
+                               trees["ground"], trees["trunk_top"], trees["leaf_top"], trees["leaf_half"],
+                               trees.get("seed", 42))
+    floor = desc.get("floor")
+    if floor:
+        checker = floor.get("checker")
+        floor = Floor(floor.get("y", 0.0), floor.get("color", (200, 200, 200)), floor.get("grass_scale"),
+                      checker and tuple(tuple(c) for c in checker), floor.get("lit", True))
+    light = dict(desc.get("light", {}))
+    scene = Scene(boxes,
+                  floor=floor,
+                  light=Light(light.pop("direction", [0.6, 1.0, 0.4]), **light),
+                  sky_color=tuple(desc.get("sky_color", (135, 206, 235))),
+                  face_mode=desc.get("face_mode", "axis"),
+                  face_eps=desc.get("face_eps", 0.005))
+    scene.bvh()
+    settings = {"name": desc.get("name", "scene"), "width": desc.get("width", 800), "height": desc.get("height", 800),
+                "sky": desc.get("sky"), "skin": desc.get("skin"), "post": desc.get("post", [])}
+    return {"scene": scene, "camera": _camera(desc["camera"]), "settings": settings}
+
+def load_compiled(compiled):
+    # Attach the (cached) sky and skin textures; returns (scene, camera, settings)
+    scene, settings = compiled["scene"], compiled["settings"]
+    if settings["sky"]:
+        scene.sky = load_sky(workspace_path(settings["sky"]))
+    if settings["skin"]:
+        scene.skin = load_skin(workspace_path(settings["skin"]))
+    elif scene.geometry.textured.any():
+        # uv boxes without a skin get the red placeholder, as for a missing skin file
+        scene.skin = load_skin(None)
+    return scene, compiled["camera"], settings
+
+def load_scene_file(path, cache_dir=None):
+    """Compile a scene file, or load its compiled form from cache_dir.
+
+    Entries are keyed on a hash of the file's bytes (and COMPILER_VERSION),
+    so any edit recompiles and a hit skips parsing and scene building
+    entirely. Textures are not part of the key; they are loaded fresh.
+    """
+    cache_dir = cache_dir or workspace_path("scene-cache")
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f"{COMPILER_VERSION}:".encode() + f.read()).hexdigest()
+    cached = os.path.join(cache_dir, f"{digest}.pickle")
+    if os.path.exists(cached):
+        with open(cached, "rb") as f:
+            return load_compiled(pickle.load(f))
+    compiled = compile_scene(read_scene_file(path))
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = f"{cached}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(compiled, f, pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, cached)
+    return load_compiled(compiled)
+
+def apply_post(img, ops):
+    # ops like [["color", 1.4], ["contrast", 1.1], ["sharpen"]], applied in order
+    for name, *args in ops:
+        img = ENHANCE[name](img).enhance(*args) if name in ENHANCE else img.filter(FILTERS[name])
+    return img
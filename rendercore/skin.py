@@ -0,0 +1,52 @@
+from functools import lru_cache
+import numpy as np
+from PIL import Image
+
+# Box faces in normal order: +x, -x, +y, -y, +z, -z
+FACES = ("right", "left", "top", "bottom", "front", "back")
+
+def face_rects(uv):
+    # (6, 4) skin rect per face. A plain (u, v, w, h) tuple covers every face;
+    # a dict maps face names to rects, with "front" filling in missing faces.
+    if uv is None:
+        return np.zeros((6, 4))
+    if isinstance(uv, dict):
+        return np.array([uv.get(face, uv["front"]) for face in FACES], dtype=float)
+    return np.tile(np.array(uv, dtype=float), (6, 1))
+
+def face_ids(normals):
+    # Index into FACES from the dominant axis of each normal
+    axis = np.argmax(np.abs(normals), axis=1)
+    return axis * 2 + (normals[np.arange(len(normals)), axis] < 0)
+
+class SkinAtlas:
+    """Minecraft skin kept as a flat uint8 texel array for batched lookups."""
+
+    def __init__(self, pixels):
+        self.height, self.width = pixels.shape[:2]
+        self.pixels = pixels[:, :, :3]
+        self.flat = np.ascontiguousarray(self.pixels).reshape(-1, 3)
+
+    def sample(self, rects, uv_x, uv_y, inset=0.0):
+        # rects is (N, 4); uv in [0, 1] across the face, inset keeps u=1 inside the rect
+        u_start, v_start, u_w, v_h = rects.T
+        sx = np.trunc(u_start + uv_x * (u_w - inset)).astype(int) % self.width
+        sy = np.trunc(v_start + uv_y * (v_h - inset)).astype(int) % self.height
+        return self.flat[sy * self.width + sx]
+
+    def average(self, rect):
+        sx, sy, sw, sh = rect
+        crop = self.pixels[sy:sy+sh, sx:sx+sw]
+        if crop.size == 0: return (100, 100, 100)
+        return tuple(int(c) for c in crop.mean(axis=(0, 1)))
+
+@lru_cache(maxsize=16)
+def load_skin(path):
+    # Cached per path so batch jobs decode each skin PNG once; a missing
+    # file gives the usual solid red placeholder
+    try:
+        pixels = np.asarray(Image.open(path).convert("RGBA"))
+    except Exception:
+        pixels = np.zeros((64, 64, 4), dtype=np.uint8)
+        pixels[:] = (255, 0, 0, 255)
+    return SkinAtlas(pixels)
@@ -0,0 +1,50 @@
+import math
+from functools import lru_cache
+import numpy as np
+from PIL import Image
+
+@lru_cache(maxsize=8)
+def _read_sky(path):
+    pixels = np.asarray(Image.open(path).convert("RGB"))
+    pixels.flags.writeable = False
+    return pixels
+
+class SkyMap:
+    """Equirectangular sky texture sampled by ray direction.
+
+    The image is decoded once per path and kept as a flat (H*W, 3) array so
+    a whole batch of directions resolves with one gather. "nearest" matches
+    the old per-pixel lookup exactly; "bilinear" blends the four texels.
+    """
+
+    def __init__(self, pixels, filter="nearest"):
+        self.height, self.width = pixels.shape[:2]
+        self.flat = np.ascontiguousarray(pixels[:, :, :3]).reshape(-1, 3)
+        self.filter = filter
+
+    def texel_coords(self, ray_d):
+        phi = np.arctan2(ray_d[:, 0], ray_d[:, 2])
+        theta = np.arccos(ray_d[:, 1])
+        return (phi + math.pi) / (2 * math.pi) * (self.width-1), theta / math.pi * (self.height-1)
+
+    def sample(self, ray_d):
+        sw, sh = self.width, self.height
+        x, y = self.texel_coords(ray_d)
+        if self.filter != "bilinear":
+            return self.flat[(y.astype(int) % sh) * sw + x.astype(int) % sw]
+        x0, y0 = np.floor(x), np.floor(y)
+        fx, fy = (x - x0)[:, None], (y - y0)[:, None]
+        x0 = x0.astype(int) % sw
+        x1 = (x0 + 1) % sw # wraps around the seam
+        y0 = np.clip(y0.astype(int), 0, sh-1)
+        y1 = np.minimum(y0 + 1, sh-1)
+        top = self.flat[y0 * sw + x0] * (1 - fx) + self.flat[y0 * sw + x1] * fx
+        bottom = self.flat[y1 * sw + x0] * (1 - fx) + self.flat[y1 * sw + x1] * fx
+        return np.rint(top * (1 - fy) + bottom * fy).astype(np.uint8)
+
+def load_sky(path, filter="nearest"):
+    # SkyMap for the image at path, or None when the file is missing
+    try:
+        return SkyMap(_read_sky(path), filter)
+    except Exception:
+        return None
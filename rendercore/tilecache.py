@@ -0,0 +1,121 @@
+import hashlib
+import os
+import time
+import numpy as np
+from PIL import Image
+
+from .tiles import TILE, RenderPool, split_tiles
+from .workspace import save_array
+
+# Bump whenever the tracer, shading, kernels or textures sampling change what
+# a tile looks like, so existing cache directories stop serving stale tiles
+TILE_CACHE_VERSION = 1
+
+def _texture_key(tex):
+    # Content hash of a sky / skin texture, computed once per texture object
+    if tex is None:
+        return None
+    if getattr(tex, "_digest", None) is None:
+        tex._digest = hashlib.sha256(np.ascontiguousarray(tex.flat).tobytes()).hexdigest()
+    return tex._digest, getattr(tex, "filter", None)
+
+def _fields(obj):
+    if obj is None:
+        return None
+    return type(obj).__name__, sorted((k, np.asarray(v).tolist()) for k, v in vars(obj).items()
+                                     if not k.startswith("_"))
+
+def scene_key(scene, camera, width, height):
+    # Everything every tile depends on: renderer version, camera, frame size,
+    # floor, light, sky, skin
+    parts = (TILE_CACHE_VERSION, _fields(camera), width, height, _fields(scene.floor), _fields(scene.light), scene.sky_color,
+             scene.face_mode, scene.face_eps, _texture_key(scene.sky), _texture_key(scene.skin))
+    return repr(parts).encode()
+
+def box_rows(geo):
+    # One float64 row per box holding its shape and material, for hashing;
+    # the oriented-box columns stay zero for axis-aligned boxes
+    m = geo.material
+    obb = np.zeros((len(geo), 15))
+    obb[geo.rotated] = np.hstack([geo.center, geo.half, geo.inv_rot.reshape(-1, 9)])
+    return np.hstack([geo.min, geo.max, obb, geo.oriented[:, None], geo.colors[m], geo.uv[m].reshape(-1, 24),
+                      geo.textured[m, None], geo.specular[m, None], geo.shininess[m, None],
+                      geo.lit[m, None]]).astype(float)
+
+def footprints(scene, camera, width, height):
+    """(N, 4) screen rects (x0, y0, x1, y1) each box can change, in pixels.
+
+    A box covers the projection of its bounds; with shadows on it also
+    covers its shadow, the bounds swept away from the light down to the
+    lowest surface. Anything reaching behind the camera covers the frame.
+    """
+    geo = scene.geometry
+    if not len(geo):
+        return np.empty((0, 4))
+    corners = np.stack([np.where(np.array([i & 1, i & 2, i & 4]) > 0, geo.max, geo.min) for i in range(8)], axis=1)
+    light = scene.light
+    if light.shadows:
+        ground = min(geo.min[:, 1].min(), scene.floor.y if scene.floor is not None else np.inf)
+        if light.direction[1] > 1e-6:
+            reach = (corners[..., 1] - ground) / light.direction[1]
+            corners = np.concatenate([corners, corners - reach[..., None] * light.direction], axis=1)
+        else:
+            corners = np.concatenate([corners, corners - 1e9 * light.direction], axis=1)
+    px, py, depth = camera.project(corners.reshape(-1, 3), width, height)
+    px, py, depth = (a.reshape(len(geo), -1) for a in (px, py, depth))
+    rects = np.stack([px.min(axis=1), py.min(axis=1), px.max(axis=1), py.max(axis=1)], axis=1)
+    rects[(depth <= 1e-6).any(axis=1)] = (-np.inf, -np.inf, np.inf, np.inf)
+    return rects
+
+def tile_keys(scene, camera, width, height, tiles):
+    # Hash per tile of the scene inputs plus the boxes whose footprint overlaps it
+    common = scene_key(scene, camera, width, height)
+    rows = box_rows(scene.geometry)
+    rects = footprints(scene, camera, width, height)
+    keys = []
+    for x0, y0, x1, y1 in tiles:
+        # one pixel of slack either side for rounding at the tile border
+        near = (rects[:, 0] <= x1) & (rects[:, 2] >= x0 - 1) & (rects[:, 1] <= y1) & (rects[:, 3] >= y0 - 1)
+        h = hashlib.sha256(common)
+        h.update(repr((x0, y0, x1, y1)).encode())
+        h.update(rows[near].tobytes())
+        keys.append(h.hexdigest())
+    return keys
+
+def render_cached(scene, camera, width, height, cache_dir, workers=1, tile=TILE, verbose=False):
+    """Render the frame tile by tile, reusing tiles whose inputs did not change.
+
+    Each tile is stored in cache_dir as an .npy named after tile_keys: the
+    camera, frame size, floor, light, textures and the boxes that can reach
+    it (through its pixels or by shadowing them). After a small edit only
+    the tiles the edit touches are traced again; a light change touches
+    them all. Tiles of earlier camera angles and edits stay in cache_dir
+    until it is removed, so a long editing session grows it steadily.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    tiles = split_tiles(width, height, tile)
+    frame = np.empty((height, width, 3), dtype=np.uint8)
+    start = time.time()
+    misses = []
+    for box, key in zip(tiles, tile_keys(scene, camera, width, height, tiles)):
+        x0, y0, x1, y1 = box
+        path = os.path.join(cache_dir, f"{key}.npy")
+        if os.path.exists(path):
+            frame[y0:y1, x0:x1] = np.load(path)
+        else:
+            misses.append((box, path))
+    if misses:
+        grids = [np.mgrid[y0:y1, x0:x1] for (x0, y0, x1, y1), _ in misses]
+        py = np.concatenate([g[0].ravel() for g in grids]).astype(float)
+        px = np.concatenate([g[1].ravel() for g in grids]).astype(float)
+        with RenderPool(scene, camera, width, height, workers) as pool:
+            pixels = pool.trace(px, py)
+        s = 0
+        for (x0, y0, x1, y1), path in misses:
+            n = (x1 - x0) * (y1 - y0)
+            frame[y0:y1, x0:x1] = block = pixels[s:s+n].reshape(y1 - y0, x1 - x0, 3)
+            s += n
+            save_array(path, block)
+    if verbose:
+        print(f"Tile cache: {len(tiles) - len(misses)}/{len(tiles)} tiles reused ({time.time() - start:.1f}s)")
+    return Image.fromarray(frame, "RGB")
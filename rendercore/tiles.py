@@ -0,0 +1,85 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from PIL import Image
+
+from .tracer import render_pixels
+
+TILE = 128 # 16k rays per tile keeps batches big enough to amortize NumPy overhead
+
+_worker = {}
+
+def split_tiles(width, height, tile=TILE):
+    return [(x, y, min(x + tile, width), min(y + tile, height))
+            for y in range(0, height, tile) for x in range(0, width, tile)]
+
+def render_tile(scene, camera, width, height, box):
+    x0, y0, x1, y1 = box
+    py, px = np.mgrid[y0:y1, x0:x1]
+    pixels = render_pixels(scene, camera, px.ravel().astype(float), py.ravel().astype(float), width, height)
+    return pixels.reshape(y1 - y0, x1 - x0, 3)
+
+def worker_pool(workers, **state):
+    # Process pool whose processes each get state (scene, camera, ...) once,
+    # not once per job; jobs read it back from _worker
+    return ProcessPoolExecutor(workers, initializer=_worker.update, initargs=(state,))
+
+def _render_tile_job(box):
+    return box, render_tile(_worker["scene"], _worker["camera"], _worker["width"], _worker["height"], box)
+
+def _trace_job(job):
+    px, py = job
+    return render_pixels(_worker["scene"], _worker["camera"], px, py, _worker["width"], _worker["height"])
+
+class RenderPool:
+    """Process pool for tracing whole tiles or arbitrary pixel sets (progressive passes, sample sets).
+
+    workers=None uses every core; workers=1 traces in-process.
+    """
+
+    def __init__(self, scene, camera, width, height, workers=None):
+        self.scene, self.camera, self.width, self.height = scene, camera, width, height
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = None
+        if self.workers != 1:
+            scene.bvh() # build before pickling so workers don't each rebuild it
+            self.pool = worker_pool(self.workers, scene=scene, camera=camera, width=width, height=height)
+
+    def tiles(self, boxes):
+        # (box, pixels) per tile, in order
+        if self.pool is None:
+            return ((box, render_tile(self.scene, self.camera, self.width, self.height, box)) for box in boxes)
+        return self.pool.map(_render_tile_job, boxes)
+
+    def trace(self, px, py):
+        if self.pool is None or len(px) <= TILE * TILE:
+            return render_pixels(self.scene, self.camera, px, py, self.width, self.height)
+        step = max(TILE * TILE, -(-len(px) // (self.workers * 4)))
+        jobs = [(px[s:s+step], py[s:s+step]) for s in range(0, len(px), step)]
+        return np.concatenate(list(self.pool.map(_trace_job, jobs)))
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def render_tiled(scene, camera, width, height, workers=None, tile=TILE, verbose=False):
+    """Render the frame as tiles on a process pool and stitch them together.
+
+    workers=None uses every core; workers=1 renders the tiles in-process.
+    """
+    tiles = split_tiles(width, height, tile)
+    frame = np.empty((height, width, 3), dtype=np.uint8)
+    start = time.time()
+    with RenderPool(scene, camera, width, height, workers) as pool:
+        for done, ((x0, y0, x1, y1), pixels) in enumerate(pool.tiles(tiles), 1):
+            frame[y0:y1, x0:x1] = pixels
+            if verbose and (done % 16 == 0 or done == len(tiles)):
+                print(f"Progress: {done}/{len(tiles)} tiles rendered... ({time.time() - start:.1f}s)")
+    return Image.fromarray(frame, "RGB")
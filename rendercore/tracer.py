@@ -0,0 +1,192 @@
+import time
+import numpy as np
+from PIL import Image
+
+from .camera import pixel_grid
+from .kernels import (hit_mask, intersect_aabb_batch, intersect_obb_batch, intersect_plane_batch,
+                      normalize_rows, occludes, occludes_obb, shared_direction)
+from .skin import face_ids
+
+FLOOR_N = np.array([0.0, 1.0, 0.0])
+CHUNK = 32768 # rays per batch; whole-frame temporaries are slower than cache-sized ones
+LINEAR_MAX = 2 # up to this many boxes a flat loop beats walking the BVH
+
+def box_normals_uv(scene, hit_pos, b_min, b_max):
+    # Normals plus (uv_x, uv_y) face coordinates for box hits
+    eps = scene.face_eps
+    size = b_max - b_min
+    if scene.face_mode == "front":
+        front = np.abs(hit_pos[:, 2] - b_max[:, 2]) < eps
+        top = ~front & (np.abs(hit_pos[:, 1] - b_max[:, 1]) < eps)
+        side = ~front & ~top
+        n = np.zeros_like(hit_pos)
+        n[front, 2] = 1
+        n[top, 1] = 1
+        n[side, 0] = 1
+        rel = (hit_pos - b_min) / size
+        down = (b_max[:, 1] - hit_pos[:, 1]) / size[:, 1]
+        uv_x = np.where(side, rel[:, 2], rel[:, 0])
+        uv_y = np.where(top, rel[:, 2], down)
+        return n, uv_x, uv_y, 0.01
+    n = np.where(np.abs(hit_pos - b_max) < eps, 1.0, np.where(np.abs(hit_pos - b_min) < eps, -1.0, 0.0))
+    n = normalize_rows(n)
+    uv_x = np.where(np.abs(n[:, 2]) > 0.5,
+                    (hit_pos[:, 0] - b_min[:, 0]) / size[:, 0],
+                    (hit_pos[:, 2] - b_min[:, 2]) / size[:, 2])
+    uv_y = (b_max[:, 1] - hit_pos[:, 1]) / size[:, 1]
+    return n, uv_x, uv_y, 0.0
+
+def sample_sky(scene, ray_d):
+    if scene.sky is None:
+        return scene.sky_color
+    return scene.sky.sample(ray_d)
+
+def closest_hit(scene, origin, ray_d):
+    # Returns (t, id) per ray: id -1 is sky, -2 the floor, >= 0 a box index
+    geo = scene.geometry
+    n = len(ray_d)
+    t_min = np.full(n, np.inf)
+    hit_id = np.full(n, -1)
+    if scene.floor is not None:
+        tp = intersect_plane_batch(origin, ray_d, np.array([0.0, scene.floor.y, 0.0]), FLOOR_N)
+        m = hit_mask(tp, t_min)
+        t_min[m], hit_id[m] = tp[m], -2
+    if len(geo.min) > LINEAR_MAX:
+        scene.bvh().closest_hit(origin, ray_d, t_min, hit_id)
+        return t_min, hit_id
+    # In order, so ties keep the earlier box like the old per-pixel loops
+    for gi in range(len(geo.min)):
+        if geo.oriented[gi]:
+            k = geo.obb_rows(gi)
+            tb = intersect_obb_batch(origin, ray_d, geo.center[k], geo.half[k], geo.inv_rot[k])[0]
+        else:
+            tb = intersect_aabb_batch(origin, ray_d, geo.min[gi], geo.max[gi])
+        m = hit_mask(tb, t_min)
+        t_min[m], hit_id[m] = tb[m], gi
+    return t_min, hit_id
+
+def occluded(scene, origins, direction):
+    """Shadow query: True for every origin whose ray toward direction hits a box."""
+    geo = scene.geometry
+    if len(geo.min) > LINEAR_MAX:
+        return scene.bvh().any_hit(origins, direction)
+    inv_d, flat = shared_direction(direction)
+    blocked = np.zeros(len(origins), dtype=bool)
+    for k in range(len(geo.rotated)):
+        blocked |= occludes_obb(origins, direction, geo.center[k], geo.half[k], geo.inv_rot[k])
+    rays = np.flatnonzero(~blocked)
+    plain = np.flatnonzero(~geo.oriented)
+    for s in range(0, len(plain), 16):
+        ids = plain[s:s+16]
+        hits = occludes(origins[rays], inv_d, flat, geo.min[ids], geo.max[ids])
+        blocked[rays[hits.any(axis=1)]] = True
+        rays = rays[~blocked[rays]]
+    return blocked
+
+def trace(scene, origin, ray_d):
+    """Shade a batch of primary rays; returns (N, 3) uint8 colors."""
+    geo = scene.geometry
+    light = scene.light
+    t_min, hit_id = closest_hit(scene, origin, ray_d)
+
+    hit = hit_id != -1
+    hit_pos = origin + ray_d[hit] * t_min[hit][:, None]
+    ids = hit_id[hit]
+    on_box = ids >= 0
+    hit_n = np.zeros_like(hit_pos)
+    hit_color = np.zeros_like(hit_pos)
+
+    if scene.floor is not None:
+        on_floor = ~on_box
+        hit_n[on_floor] = FLOOR_N
+        hit_color[on_floor] = scene.floor.colors(hit_pos[on_floor])
+
+    b_ids = ids[on_box]
+    b_pos = hit_pos[on_box]
+    b_n, uv_x, uv_y, inset = box_normals_uv(scene, b_pos, geo.min[b_ids], geo.max[b_ids])
+    faces = face_ids(b_n)
+    rot = geo.oriented[b_ids]
+    if rot.any():
+        # Rotated boxes: normal, face and uv come from the hit in the box's own frame
+        k = geo.obb_rows(b_ids[rot])
+        _, b_n[rot], uv, faces[rot] = intersect_obb_batch(origin, ray_d[hit][on_box][rot], geo.center[k],
+                                                          geo.half[k], geo.inv_rot[k])
+        uv_x[rot], uv_y[rot] = uv.T
+    hit_n[on_box] = b_n
+    b_mat = geo.material[b_ids]
+    b_color = geo.colors[b_mat].astype(float)
+    tex = geo.textured[b_mat]
+    if tex.any():
+        rects = geo.uv[b_mat[tex], faces[tex]]
+        b_color[tex] = scene.skin.sample(rects, uv_x[tex], uv_y[tex], inset)
+    hit_color[on_box] = b_color
+
+    shadow_factor = np.ones(len(hit_pos))
+    if light.shadows:
+        in_shadow = occluded(scene, hit_pos + hit_n * light.shadow_bias, light.direction)
+        shadow_factor[in_shadow] = light.shadow_factor
+
+    dot = np.maximum(light.min_diffuse, hit_n @ light.direction)
+    shaded = hit_color * (dot + light.ambient)[:, None] * shadow_factor[:, None]
+    lit = np.ones(len(hit_pos), dtype=bool)
+    lit[on_box] = geo.lit[b_mat]
+    if scene.floor is not None and not scene.floor.lit:
+        lit[~on_box] = False
+    shaded[~lit] = hit_color[~lit]
+
+    # Blinn-Phong highlight for lit materials that ask for it
+    spec = np.zeros(len(hit_pos))
+    spec[on_box] = np.where(geo.lit[b_mat], geo.specular[b_mat], 0.0)
+    shiny = spec > 0
+    if shiny.any():
+        view_dir = normalize_rows(origin - hit_pos[shiny])
+        half_v = normalize_rows(light.direction + view_dir)
+        power = np.zeros(len(hit_pos))
+        power[on_box] = geo.shininess[b_mat]
+        s = np.maximum(0.0, np.einsum("ij,ij->i", hit_n[shiny], half_v)) ** power[shiny] * spec[shiny]
+        shaded[shiny] += (255 * s * shadow_factor[shiny])[:, None]
+
+    out = np.empty((len(ray_d), 3), dtype=np.uint8)
+    out[hit] = np.clip(shaded.astype(int), 0, 255)
+    out[~hit] = sample_sky(scene, ray_d[~hit])
+    return out
+
+def render_pixels(scene, camera, px, py, width, height, chunk=CHUNK, verbose=False):
+    # Trace arbitrary pixel positions (e.g. a tile or a jittered sample set)
+    out = np.empty((len(px), 3), dtype=np.uint8)
+    start = time.time()
+    for s in range(0, len(px), chunk):
+        if verbose and s % (chunk * 16) == 0:
+            print(f"Progress: {s}/{len(px)} rays traced... ({time.time() - start:.1f}s)")
+        ray_d = camera.rays(px[s:s+chunk], py[s:s+chunk], width, height)
+        out[s:s+chunk] = trace(scene, camera.pos, ray_d)
+    return out
+
+def render(scene, camera, width, height, workers=1, on_pass=None, chunk=CHUNK, verbose=False, samples=1,
+           tile_cache=None, tolerance=None):
+    # on_pass(img, step) switches to coarse-to-fine passes with previews, which
+    # fill flat cells instead of tracing them given a tolerance; tile_cache (a
+    # directory) reuses tiles unchanged since an earlier render and has no
+    # previews; samples > 1 antialiases the edges of the result
+    if tile_cache is not None and on_pass is not None:
+        raise ValueError("tile_cache renders have no progressive previews; pass on_pass or tile_cache, not both")
+    if tolerance is not None and on_pass is None:
+        raise ValueError("tolerance only applies to progressive renders; pass on_pass with it")
+    if tile_cache is not None:
+        from .tilecache import render_cached
+        img = render_cached(scene, camera, width, height, tile_cache, workers, verbose=verbose)
+    elif on_pass is not None:
+        from .progressive import render_progressive
+        img = render_progressive(scene, camera, width, height, workers, on_pass, tolerance=tolerance,
+                                 verbose=verbose)
+    elif workers != 1:
+        from .tiles import render_tiled
+        img = render_tiled(scene, camera, width, height, workers, verbose=verbose)
+    else:
+        px, py = pixel_grid(width, height)
+        frame = render_pixels(scene, camera, px, py, width, height, chunk, verbose)
+        img = Image.fromarray(frame.reshape(height, width, 3), "RGB")
+    if samples > 1:
+        from .antialias import antialias
+        img = antialias(scene, camera, img, samples, workers, verbose=verbose)
+    return img
@@ -0,0 +1,23 @@
+import os
+import time
+import numpy as np
+
+# ARIA_WORKSPACE redirects every script's inputs and outputs (benchmarks, CI)
+WORKSPACE = os.environ.get("ARIA_WORKSPACE", "/home/claw/.openclaw/workspace")
+
+def workspace_path(name):
+    return os.path.join(WORKSPACE, name)
+
+def save_media(img, prefix):
+    timestamp = int(time.time())
+    path = workspace_path(f"{prefix}_{timestamp}.png")
+    img.save(path)
+    print(f"MEDIA:{path}")
+    return path
+
+def save_array(path, array):
+    # np.save to a private file renamed over path, so readers (other processes
+    # sharing a cache directory) never load a half-written .npy
+    tmp = f"{path[:-4]}.{os.getpid()}.tmp.npy"
+    np.save(tmp, array)
+    os.replace(tmp, path)